@@ -21,10 +21,9 @@ import rigid_load_transfer as rlt
 # Calculation functions
 def create_rotation_matrix(euler_angles, rotation_order, translation):
     R = np.eye(3)
-    for axis in reversed(rotation_order.lower()):
-        idx = rotation_order.lower().index(axis)
-        angle = euler_angles[idx]
-        R = R @ _axis_rotation(axis, angle)
+    order = rotation_order.lower()
+    for idx in range(len(order) - 1, -1, -1):
+        R = R @ _axis_rotation(order[idx], euler_angles[idx])
     return R, np.array(translation)
 
 def _axis_rotation(axis, angle):
@@ -42,11 +41,12 @@ def rigid_load_transfer(force_local_A, moment_local_A, R_A, point_A_global, R_B,
     force_global = R_A @ force_local_A
     moment_global = R_A @ moment_local_A
     r = point_A_global - point_B_global
-    moment_global += np.cross(r, force_global)
+    moment_global += rlt.cross3(r, force_global)
     return R_B.T @ force_global, R_B.T @ moment_global
 # #---------------------------------------
 # Visualization helpers
-def create_vector(position, vector, color='red', name=None, legendgroup= None, triad_name=None):
+def vector_end_point(position, vector):
+    """End point of a drawn vector: its direction, auto-scaled to a length of 0.5 to 2"""
     magnitude = np.linalg.norm(vector)
     # print(magnitude)
     scale = max(0.5, min(2.0, magnitude/10))  # Auto-scale based on magnitude
@@ -63,8 +63,10 @@ def create_vector(position, vector, color='red', name=None, legendgroup= None, t
     x=float(position[0]) + vector_x*scale
     y=float(position[1]) + vector_y*scale
     z=float(position[2]) + vector_z*scale
-    
-    list_load = [[float(position[0]),float(position[1]),float(position[2])],[x,y,z]]
+    return [x, y, z]
+
+def create_vector(position, vector, color='red', name=None, legendgroup= None, triad_name=None):
+    list_load = [[float(position[0]),float(position[1]),float(position[2])], vector_end_point(position, vector)]
     # print(list_load)
     fig = plot_lines_from_points(list_load, colors_tip=[color],size_tip=0.3, tip_hover_text=[name], legendgroup = legendgroup,triad_name=triad_name)
     # fig = plot3d.plot_lines_from_points(list_load)
@@ -85,6 +87,100 @@ def create_connection_line(start_point, end_point, color='gray'):
         ),
         showlegend=False
     )
+
+def create_line_segments(start_points, end_points, colors, name=None, dash='dot', width=2, text=None):
+    """
+    Create independent line segments as a single trace, broken at None gaps.
+    colors (and text, if given) hold one entry per segment; with a name the
+    trace shows in the legend, otherwise it is hidden and skips hover.
+    """
+    x, y, z, line_colors, hover_text = [], [], [], [], []
+    for i, (start_point, end_point) in enumerate(zip(start_points, end_points)):
+        x += [start_point[0], end_point[0], None]
+        y += [start_point[1], end_point[1], None]
+        z += [start_point[2], end_point[2], None]
+        line_colors += [colors[i]] * 3
+        if text is not None:
+            hover_text += [text[i]] * 3
+    return go.Scatter3d(
+        x=x,
+        y=y,
+        z=z,
+        mode='lines',
+        line=dict(
+            color=line_colors,
+            dash=dash,
+            width=width
+        ),
+        name=name,
+        legendgroup=name,
+        text=hover_text if text is not None else None,
+        hoverinfo='skip' if name is None else None,
+        showlegend=name is not None
+    )
+
+def create_arrows(start_points, end_points, line_colors, tip_color, size_tip=0.1, name=None, hover_text=None):
+    """
+    Create many arrows as two traces: one Scatter3d for all shafts and one
+    Cone for all tips. line_colors (and hover_text) hold one entry per arrow.
+    """
+    start_points = np.asarray(start_points, dtype=float).reshape(-1, 3)
+    end_points = np.asarray(end_points, dtype=float).reshape(-1, 3)
+    # Unit directions with absolute sizing give every tip the same size
+    directions = end_points - start_points
+    norms = np.linalg.norm(directions, axis=1, keepdims=True)
+    directions = np.divide(directions, norms, out=np.zeros_like(directions), where=norms > 0)
+    shafts = create_line_segments(start_points, end_points, line_colors, name=name, dash='solid')
+    tips = go.Cone(
+        x=end_points[:, 0],
+        y=end_points[:, 1],
+        z=end_points[:, 2],
+        u=directions[:, 0],
+        v=directions[:, 1],
+        w=directions[:, 2],
+        showscale=False,
+        sizemode="absolute",
+        sizeref=size_tip,
+        anchor="tip",
+        colorscale=[[0, tip_color], [1, tip_color]],
+        hoverinfo='text',
+        hovertext=hover_text,
+        name=name,
+        legendgroup=name,
+        showlegend=False
+    )
+    return [shafts, tips]
+
+def update_arrows(shafts, tips, start_points, end_points, line_colors, hover_text=None):
+    """
+    Redraw the arrows of a shafts/tips trace pair from create_arrows in place,
+    with the same arguments. With no arrows the pair is hidden.
+    """
+    start_points = np.asarray(start_points, dtype=float).reshape(-1, 3)
+    end_points = np.asarray(end_points, dtype=float).reshape(-1, 3)
+    directions = end_points - start_points
+    norms = np.linalg.norm(directions, axis=1, keepdims=True)
+    directions = np.divide(directions, norms, out=np.zeros_like(directions), where=norms > 0)
+    # Start, end and gap per shaft; NaN gaps are written out as null
+    points = np.stack([start_points, end_points, np.full_like(start_points, np.nan)], axis=1).reshape(-1, 3)
+    visible = len(start_points) > 0
+    shafts.update(
+        visible=visible,
+        x=points[:, 0],
+        y=points[:, 1],
+        z=points[:, 2],
+        line_color=[color for color in line_colors for _ in range(3)]
+    )
+    tips.update(
+        visible=visible,
+        x=end_points[:, 0],
+        y=end_points[:, 1],
+        z=end_points[:, 2],
+        u=directions[:, 0],
+        v=directions[:, 1],
+        w=directions[:, 2],
+        hovertext=hover_text
+    )
 # #---------------------------------------
 def plot_3d_point(list):
     """
@@ -240,7 +336,8 @@ def plot_lines_from_points(first_pair, *list_pair, size_tip=0.1, colors=None, co
     fig0 = plot_arrow_tip(first_pair, sizetip=size_tip, color=colors_tip[0], name=triad_name, 
                          showlegend=True, legendgroup=legendgroup, hover_text = tip_hover_text[0])
     
-    fig = go.Figure(data=fig1.data + fig0.data)
+    # Collect the traces and build the figure once, instead of copying it per line
+    traces = [*fig1.data, *fig0.data]
     
     for i, pair in enumerate(list_pair, 1):
         fig1 = plot_3d_line(pair, color=colors[i], name=triad_name, 
@@ -248,8 +345,10 @@ def plot_lines_from_points(first_pair, *list_pair, size_tip=0.1, colors=None, co
         fig0 = plot_arrow_tip(pair, sizetip=size_tip, color=colors_tip[i], 
                             showlegend=False, legendgroup=legendgroup,hover_text = tip_hover_text[i])
         
-        fig2 = go.Figure(data=fig.data + fig1.data + fig0.data)
-        fig = fig2
+        traces.extend(fig1.data)
+        traces.extend(fig0.data)
+
+    fig = go.Figure(data=traces)
 
     fig.update_layout(
         margin={'l': 0, 'r': 0, 'b': 0, 't': 30},
@@ -327,7 +426,8 @@ def plot_lines_from_points(first_pair, *list_pair, size_tip=0.1, colors=None, co
 #     )
 #     return fig
 def plot_triad(R, rotation_order, Position, colour_triad=['red', 'green', 'blue'], 
-               colors_arr='magenta', tip_size=0.1, len_triad=1, triad_name = "Coordinate Triad", legendgroup = None):
+               colors_arr='magenta', tip_size=0.1, len_triad=1, triad_name = "Coordinate Triad", legendgroup = None,
+               rotation_matrix=None):
     """
     Plots a coordinate system triad given rotation and position.
     
@@ -339,11 +439,15 @@ def plot_triad(R, rotation_order, Position, colour_triad=['red', 'green', 'blue'
         colors_arr (str): Color for arrow tips. (default='magenta')
         tip_size (float): Size of arrow tips. (default=0.1)
         len_triad (float): Length of triad axes. (default=1)
+        rotation_matrix (np.ndarray): Precomputed 3x3 rotation for R, skips rebuilding it. (default=None)
     
     Returns:
         go.Figure: Plotly figure object
     """
-    R_A, pos = create_rotation_matrix(R, rotation_order, Position)
+    if rotation_matrix is None:
+        R_A, pos = create_rotation_matrix(R, rotation_order, Position)
+    else:
+        R_A, pos = rotation_matrix, np.array(Position)
     x = R_A @ np.array([1,0,0])
     y = R_A @ np.array([0,1,0])
     z = R_A @ np.array([0,0,1])
@@ -378,6 +482,13 @@ def plot_triad(R, rotation_order, Position, colour_triad=['red', 'green', 'blue'
     
     fig.update_layout(scene_aspectmode='data')
     return fig
+
+def triad_segments(rotation_matrix, Position, len_triad=1):
+    """Start and end points of a triad's x, y and z axes, each of shape (3, 3)"""
+    pos = np.asarray(Position, dtype=float)
+    axes = np.asarray(rotation_matrix, dtype=float).T
+    axes = axes * (len_triad / np.linalg.norm(axes, axis=1, keepdims=True))
+    return np.tile(pos, (3, 1)), pos + axes
 #---------------------------------------
 
 def surf_plot(x_data, y_data, z_data):
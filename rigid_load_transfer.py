@@ -7,14 +7,55 @@
 
 """
 import numpy as np
+from functools import lru_cache
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    # numba is optional, without it the kernels below run as plain NumPy
+    _HAS_NUMBA = False
+    prange = range
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+try:
+    from scipy.spatial.transform import Rotation
+except ImportError:
+    # scipy is optional, rotations are then composed from single-axis matrices
+    Rotation = None
+
+_AXIS_INDEX = {'x': 0, 'y': 1, 'z': 2}
 
 def create_rotation_matrix(euler_angles, rotation_order, translation):
-    R = np.eye(3)
-    for axis in reversed(rotation_order.lower()):
-        idx = rotation_order.lower().index(axis)
-        angle = euler_angles[idx]
-        R = R @ _axis_rotation(axis, angle)
-    return R, np.array(translation)
+    return _rotation_matrix_cached(tuple(map(float, euler_angles)), rotation_order), np.asarray(translation, dtype=np.float64)
+
+@lru_cache(maxsize=1024)
+def _rotation_matrix_cached(euler_angles, rotation_order):
+    # Shared between callers, so it is returned read-only
+    order = rotation_order.lower()
+    nonzero = [idx for idx, angle in enumerate(euler_angles) if angle != 0]
+    if not nonzero:
+        R = np.eye(3)
+    elif len(nonzero) == 1:
+        # Single-axis rotation: one sin/cos pair, no composition needed
+        R = _axis_rotation(order[nonzero[0]], euler_angles[nonzero[0]])
+    elif order in _TAIT_BRYAN:
+        # One closed form covers the six orders with distinct axes
+        R = _tait_bryan_to_R(np.asarray(euler_angles, dtype=np.float64), *_TAIT_BRYAN[order])
+    elif _HAS_NUMBA:
+        # Orders repeating an axis (e.g. 'zxz') through the compiled kernel
+        R = _euler_axes_to_R(np.asarray(euler_angles, dtype=np.float64),
+                             np.array([_AXIS_INDEX[axis] for axis in order], dtype=np.int64))
+    elif Rotation is not None:
+        # Lower-case sequences are extrinsic in scipy, which matches our convention
+        R = Rotation.from_euler(order, euler_angles).as_matrix()
+    else:
+        R = np.eye(3)
+        for idx in range(len(order) - 1, -1, -1):
+            R = R @ _axis_rotation(order[idx], euler_angles[idx])
+    R.flags.writeable = False
+    return R
 
 def _axis_rotation(axis, angle):
     cos_a = np.cos(angle)
@@ -27,12 +68,193 @@ def _axis_rotation(axis, angle):
         return np.array([[cos_a, -sin_a, 0], [sin_a, cos_a, 0], [0, 0, 1]])
     raise ValueError(f"Invalid axis: {axis}")
 
+# Orders with three distinct axes, as (axis indices, permutation parity)
+_TAIT_BRYAN = {order: (np.array([_AXIS_INDEX[axis] for axis in order], dtype=np.int64), sign)
+               for order, sign in [('xyz', 1.0), ('yzx', 1.0), ('zxy', 1.0),
+                                   ('xzy', -1.0), ('yxz', -1.0), ('zyx', -1.0)]}
+
+@njit(cache=True)
+def _tait_bryan_to_R(euler_angles, axes, sign):
+    # Closed form of R_c(e2) @ R_b(e1) @ R_a(e0) for distinct axes a, b, c.
+    # With P the permutation taking x, y, z to a, b, c this is
+    # P @ Rz(s*e2) @ Ry(s*e1) @ Rx(s*e0) @ P.T, s being the parity of P
+    ca, cb, cc = np.cos(euler_angles[0]), np.cos(euler_angles[1]), np.cos(euler_angles[2])
+    sa, sb, sc = sign*np.sin(euler_angles[0]), sign*np.sin(euler_angles[1]), sign*np.sin(euler_angles[2])
+    i, j, k = axes[0], axes[1], axes[2]
+    R = np.empty((3, 3))
+    R[i, i], R[i, j], R[i, k] = cb*cc, sa*sb*cc - ca*sc, ca*sb*cc + sa*sc
+    R[j, i], R[j, j], R[j, k] = cb*sc, sa*sb*sc + ca*cc, ca*sb*sc - sa*cc
+    R[k, i], R[k, j], R[k, k] = -sb, sa*cb, ca*cb
+    return R
+
+# Unrolled 3x3 matrix-vector products: numba would route @ on these tiny
+# shapes through BLAS, which costs more than the nine multiply-adds
+@njit(fastmath=True, inline='always')
+def _mul33_v3(R, v):
+    out = np.empty(3)
+    out[0] = R[0, 0]*v[0] + R[0, 1]*v[1] + R[0, 2]*v[2]
+    out[1] = R[1, 0]*v[0] + R[1, 1]*v[1] + R[1, 2]*v[2]
+    out[2] = R[2, 0]*v[0] + R[2, 1]*v[1] + R[2, 2]*v[2]
+    return out
+
+@njit(fastmath=True, inline='always')
+def _mul33T_v3(R, v):
+    # R.T @ v
+    out = np.empty(3)
+    out[0] = R[0, 0]*v[0] + R[1, 0]*v[1] + R[2, 0]*v[2]
+    out[1] = R[0, 1]*v[0] + R[1, 1]*v[1] + R[2, 1]*v[2]
+    out[2] = R[0, 2]*v[0] + R[1, 2]*v[1] + R[2, 2]*v[2]
+    return out
+
+if not _HAS_NUMBA:
+    # Interpreted, the unrolled products are slower than NumPy's matmul
+    def _mul33_v3(R, v):
+        return R @ v
+
+    def _mul33T_v3(R, v):
+        return R.T @ v
+
+@njit(cache=True)
+def _rigid_load_transfer_kernel(force_local_A, moment_local_A, R_A, point_A_global, R_B, point_B_global):
+    force_global = _mul33_v3(R_A, force_local_A)
+    moment_global = _mul33_v3(R_A, moment_local_A)
+    rx = point_A_global[0] - point_B_global[0]
+    ry = point_A_global[1] - point_B_global[1]
+    rz = point_A_global[2] - point_B_global[2]
+    moment_global[0] += ry*force_global[2] - rz*force_global[1]
+    moment_global[1] += rz*force_global[0] - rx*force_global[2]
+    moment_global[2] += rx*force_global[1] - ry*force_global[0]
+    return _mul33T_v3(R_B, force_global), _mul33T_v3(R_B, moment_global)
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _rigid_load_transfer_batched_kernel(forces_local, moments_local, R_loads, load_pos, R_targets, target_pos):
+    n_loads = forces_local.shape[0]
+    n_targets = target_pos.shape[0]
+
+    # Loads in global coordinates, shared by every target
+    forces_global = np.empty((n_loads, 3))
+    moments_global = np.empty((n_loads, 3))
+    for k in range(n_loads):
+        for i in range(3):
+            forces_global[k, i] = (R_loads[k, i, 0]*forces_local[k, 0] + R_loads[k, i, 1]*forces_local[k, 1]
+                                   + R_loads[k, i, 2]*forces_local[k, 2])
+            moments_global[k, i] = (R_loads[k, i, 0]*moments_local[k, 0] + R_loads[k, i, 1]*moments_local[k, 1]
+                                    + R_loads[k, i, 2]*moments_local[k, 2])
+
+    out_F = np.empty((n_targets, n_loads, 3))
+    out_M = np.empty((n_targets, n_loads, 3))
+    for t in prange(n_targets):
+        R = R_targets[t]
+        for k in range(n_loads):
+            F0, F1, F2 = forces_global[k, 0], forces_global[k, 1], forces_global[k, 2]
+            r0 = load_pos[k, 0] - target_pos[t, 0]
+            r1 = load_pos[k, 1] - target_pos[t, 1]
+            r2 = load_pos[k, 2] - target_pos[t, 2]
+            M0 = moments_global[k, 0] + r1*F2 - r2*F1
+            M1 = moments_global[k, 1] + r2*F0 - r0*F2
+            M2 = moments_global[k, 2] + r0*F1 - r1*F0
+            for i in range(3):
+                out_F[t, k, i] = R[0, i]*F0 + R[1, i]*F1 + R[2, i]*F2
+                out_M[t, k, i] = R[0, i]*M0 + R[1, i]*M1 + R[2, i]*M2
+    return out_F, out_M
+
+# Compile the kernels at import so the first real call doesn't pay for it
+_tait_bryan_to_R(np.zeros(3), *_TAIT_BRYAN['xyz'])
+_rigid_load_transfer_kernel(np.zeros(3), np.zeros(3), np.eye(3), np.zeros(3), np.eye(3), np.zeros(3))
+_rigid_load_transfer_batched_kernel(np.zeros((1, 3)), np.zeros((1, 3)), np.eye(3)[None], np.zeros((1, 3)),
+                                    np.eye(3)[None], np.zeros((1, 3)))
+
+def _axis_quat(axis, angle):
+    q = np.zeros(4)
+    q[0] = np.cos(0.5 * angle)
+    q[_AXIS_INDEX[axis] + 1] = np.sin(0.5 * angle)
+    return q
+
+def _quat_multiply(p, q):
+    pw, px, py, pz = p
+    qw, qx, qy, qz = q
+    return np.array([pw*qw - px*qx - py*qy - pz*qz,
+                     pw*qx + px*qw + py*qz - pz*qy,
+                     pw*qy - px*qz + py*qw + pz*qx,
+                     pw*qz + px*qy - py*qx + pz*qw])
+
+def _quat_conjugate(q):
+    return np.array([q[0], -q[1], -q[2], -q[3]])
+
+def _euler_to_quat(euler_angles, rotation_order):
+    return _quat_cached(tuple(map(float, euler_angles)), rotation_order)
+
+@lru_cache(maxsize=1024)
+def _quat_cached(euler_angles, rotation_order):
+    # Same convention as create_rotation_matrix: q = q2 * q1 * q0
+    order = rotation_order.lower()
+    nonzero = [idx for idx, angle in enumerate(euler_angles) if angle != 0]
+    if not nonzero:
+        q = np.array([1.0, 0.0, 0.0, 0.0])
+    elif len(nonzero) == 1:
+        q = _axis_quat(order[nonzero[0]], euler_angles[nonzero[0]])
+    else:
+        q = _axis_quat(order[-1], euler_angles[-1])
+        for idx in range(len(order) - 2, -1, -1):
+            q = _quat_multiply(q, _axis_quat(order[idx], euler_angles[idx]))
+    q.flags.writeable = False
+    return q
+
+def _quat_rotate(q, v, out=None):
+    # v' = v + q_w * t + q_v x t, with t = 2 * q_v x v
+    if out is None:
+        out = np.empty(3)
+    w, x, y, z = q
+    vx, vy, vz = v
+    tx = 2 * (y*vz - z*vy)
+    ty = 2 * (z*vx - x*vz)
+    tz = 2 * (x*vy - y*vx)
+    out[0] = vx + w*tx + y*tz - z*ty
+    out[1] = vy + w*ty + z*tx - x*tz
+    out[2] = vz + w*tz + x*ty - y*tx
+    return out
+
+def cross3(a, b, out=None):
+    # np.cross for a single pair of 3-vectors, without its dispatch overhead
+    if out is None:
+        out = np.empty(3)
+    out[0] = a[1]*b[2] - a[2]*b[1]
+    out[1] = a[2]*b[0] - a[0]*b[2]
+    out[2] = a[0]*b[1] - a[1]*b[0]
+    return out
+
 def rigid_load_transfer(force_local_A, moment_local_A, R_A, point_A_global, R_B, point_B_global):
-    force_global = R_A @ force_local_A
-    moment_global = R_A @ moment_local_A
-    r = point_A_global - point_B_global
-    moment_global += np.cross(r, force_global)
-    return R_B.T @ force_global, R_B.T @ moment_global
+    return _rigid_load_transfer_kernel(
+        np.asarray(force_local_A, dtype=np.float64),
+        np.asarray(moment_local_A, dtype=np.float64),
+        np.asarray(R_A, dtype=np.float64),
+        np.asarray(point_A_global, dtype=np.float64),
+        np.asarray(R_B, dtype=np.float64),
+        np.asarray(point_B_global, dtype=np.float64)
+    )
+
+def rigid_load_transfer_batched(forces_local, moments_local, R_loads, load_pos, R_targets, target_pos):
+    """
+    rigid_load_transfer for every (target, load) pair: loads are given as
+    (L, 3) forces/moments/positions with (L, 3, 3) rotations, targets as
+    (T, 3, 3) rotations and (T, 3) positions. Returns the (T, L, 3) forces
+    and moments of each load in each target system.
+    """
+    forces_local = np.asarray(forces_local, dtype=np.float64).reshape(-1, 3)
+    moments_local = np.asarray(moments_local, dtype=np.float64).reshape(-1, 3)
+    R_loads = np.asarray(R_loads, dtype=np.float64).reshape(-1, 3, 3)
+    load_pos = np.asarray(load_pos, dtype=np.float64).reshape(-1, 3)
+    R_targets = np.asarray(R_targets, dtype=np.float64).reshape(-1, 3, 3)
+    target_pos = np.asarray(target_pos, dtype=np.float64).reshape(-1, 3)
+    if _HAS_NUMBA:
+        return _rigid_load_transfer_batched_kernel(forces_local, moments_local, R_loads, load_pos,
+                                                   R_targets, target_pos)
+    force_global = (R_loads @ forces_local[..., None])[..., 0]
+    moment_global = (R_loads @ moments_local[..., None])[..., 0]
+    moment_global = moment_global + np.cross(load_pos - target_pos[:, None], force_global)
+    R_targets_T = R_targets.swapaxes(-1, -2)[:, None]
+    return ((R_targets_T @ force_global[..., None])[..., 0],
+            (R_targets_T @ moment_global[..., None])[..., 0])
 
 # Example usage
 if __name__ == "__main__":
@@ -79,12 +301,12 @@ def combine_loads(loads, target_system, include_gravity=True, gravity_data=None)
         total_force: Combined force in target system
         total_moment: Combined moment in target system
     """
-    # Create target system rotation matrix
-    R_target, target_pos = create_rotation_matrix(
+    # Target system orientation as a quaternion; only its inverse is needed
+    q_target_inv = _quat_conjugate(_euler_to_quat(
         target_system['euler_angles'],
-        target_system['rotation_order'],
-        target_system['translation']
-    )
+        target_system['rotation_order']
+    ))
+    target_pos = np.asarray(target_system['translation'], dtype=np.float64)
 
     total_force = np.zeros(3)
     total_moment = np.zeros(3)
@@ -94,61 +316,314 @@ def combine_loads(loads, target_system, include_gravity=True, gravity_data=None)
         gravity_data = {'value': 9.81, 'direction': [0, 0, -1]}
     
     # Normalize gravity direction
-    gravity_dir = np.array(gravity_data.get('direction', [0, 0, -1]))
+    gravity_dir = np.asarray(gravity_data.get('direction', [0, 0, -1]), dtype=np.float64)
     gravity_norm = np.linalg.norm(gravity_dir)
     if gravity_norm > 0:
         gravity_dir = gravity_dir / gravity_norm
     gravity_value = gravity_data.get('value', 9.81)
 
+    # Split off the loads that carry gravity once, so neither loop below
+    # has to branch on it
+    if include_gravity:
+        loads_with_mass = [load for load in loads if load.get('mass', 0) > 0]
+    else:
+        loads_with_mass = []
+
+    # Scratch buffers reused for every load
+    force = np.empty(3)
+    moment = np.empty(3)
+    lever = np.empty(3)
+    r_target = np.empty(3)
+    force_target = np.empty(3)
+    moment_target = np.empty(3)
+    cross = np.empty(3)
+    cog_global = np.empty(3)
+
+    # External loads
     for load in loads:
-        # Create source system rotation matrix
-        R_source, source_pos = create_rotation_matrix(
-            load['euler_angles'],
-            load['rotation_order'],
-            load['translation']
-        )
+        # Source system orientation as a quaternion, and the source-to-target
+        # rotation fused into one quaternion
+        q_source = _euler_to_quat(load['euler_angles'], load['rotation_order'])
+        q_rel = _quat_multiply(q_target_inv, q_source)
+
+        # Lever arm from target to source origin, expressed in the target system
+        np.subtract(load['translation'], target_pos, out=lever)
+        _quat_rotate(q_target_inv, lever, out=r_target)
 
         # Get force and moment, defaulting to zeros if not present
-        force = np.array(load.get('force', [0, 0, 0]))
-        moment = np.array(load.get('moment', [0, 0, 0]))
-        
-        # Calculate gravity force if mass is present and gravity is enabled
-        if include_gravity and 'mass' in load and load['mass'] > 0:
-            mass = float(load['mass'])
-            
-            # Get center of gravity or use load position if not specified
-            cog_local = np.array(load.get('cog', [0, 0, 0]))
-            
-            # Calculate gravity force in global coordinates
-            gravity_force_global = mass * gravity_value * gravity_dir
-            
-            # Transform gravity force to local load coordinate system
-            gravity_force_local = R_source.T @ gravity_force_global
-            
-            # Add gravity force to load force
-            force = force + gravity_force_local
-            
-            # Calculate gravity moment (only if COG is not at origin)
-            if not np.all(cog_local == 0):
-                gravity_moment_local = np.cross(cog_local, R_source.T @ gravity_force_global)
-                moment = moment + gravity_moment_local
-
-        # Transfer load to target system
-        F_trans, M_trans = rigid_load_transfer(
-            force_local_A=force,
-            moment_local_A=moment,
-            R_A=R_source,
-            point_A_global=source_pos,
-            R_B=R_target,
-            point_B_global=target_pos
-        )
+        force[:] = load.get('force', (0, 0, 0))
+        moment[:] = load.get('moment', (0, 0, 0))
+
+        # Transfer load directly to the target system
+        _quat_rotate(q_rel, force, out=force_target)
+        _quat_rotate(q_rel, moment, out=moment_target)
+        moment_target += cross3(r_target, force_target, cross)
 
         # Accumulate results
-        total_force += F_trans
-        total_moment += M_trans
+        total_force += force_target
+        total_moment += moment_target
+
+    # Gravity acts in the global frame at each COG, so its total force is
+    # (sum of m) * g and its moment about the target is (sum of m * arm) x g
+    if loads_with_mass:
+        total_mass = 0.0
+        mass_weighted_arm = np.zeros(3)
+        for load in loads_with_mass:
+            mass = float(load['mass'])
+            np.subtract(load['translation'], target_pos, out=lever)
+
+            # COG is given in local load coordinates (only matters if not at origin)
+            cog_raw = load.get('cog')
+            if cog_raw is not None:
+                cog_local = np.asarray(cog_raw, dtype=np.float64)
+                if cog_local.any():
+                    q_source = _euler_to_quat(load['euler_angles'], load['rotation_order'])
+                    lever += _quat_rotate(q_source, cog_local, out=cog_global)
+
+            total_mass += mass
+            mass_weighted_arm += mass * lever
+
+        gravity_vec = gravity_value * gravity_dir
+        total_force += _quat_rotate(q_target_inv, total_mass * gravity_vec)
+        total_moment += _quat_rotate(q_target_inv, cross3(mass_weighted_arm, gravity_vec, cross))
+
+    return total_force, total_moment
+
+def _axis_rotation_batch(axis, angles):
+    cos_a = np.cos(angles)
+    sin_a = np.sin(angles)
+    R = np.zeros((len(angles), 3, 3))
+    if axis == 'x':
+        R[:, 0, 0] = 1
+        R[:, 1, 1], R[:, 1, 2] = cos_a, -sin_a
+        R[:, 2, 1], R[:, 2, 2] = sin_a, cos_a
+    elif axis == 'y':
+        R[:, 0, 0], R[:, 0, 2] = cos_a, sin_a
+        R[:, 1, 1] = 1
+        R[:, 2, 0], R[:, 2, 2] = -sin_a, cos_a
+    elif axis == 'z':
+        R[:, 0, 0], R[:, 0, 1] = cos_a, -sin_a
+        R[:, 1, 0], R[:, 1, 1] = sin_a, cos_a
+        R[:, 2, 2] = 1
+    else:
+        raise ValueError(f"Invalid axis: {axis}")
+    return R
 
+@njit(parallel=True, fastmath=True, cache=True)
+def _rotation_matrices_kernel(euler_angles, axes):
+    # axes[k, i] is the axis index (0, 1, 2 for x, y, z) of angle i of load k
+    n = euler_angles.shape[0]
+    R = np.empty((n, 3, 3))
+    for k in prange(n):
+        R[k] = _euler_axes_to_R(euler_angles[k], axes[k])
+    return R
+
+@njit(cache=True)
+def _euler_axes_to_R(euler_angles, axes):
+    M = np.eye(3)
+    for i in range(2, -1, -1):
+        # M = M @ axis_rotation, touching only the two columns it mixes
+        c = np.cos(euler_angles[i])
+        s = np.sin(euler_angles[i])
+        p = (axes[i] + 1) % 3
+        q = (axes[i] + 2) % 3
+        for row in range(3):
+            m_p = M[row, p]
+            m_q = M[row, q]
+            M[row, p] = c*m_p + s*m_q
+            M[row, q] = c*m_q - s*m_p
+    return M
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _combine_loads_kernel(eulers, orders_int, order_axes, translations, forces, moments, masses, cogs, R_target, target_pos, gvec):
+    # orders_int[k] indexes the row of order_axes holding load k's axis indices.
+    # gvec is the global gravity vector (zeros when gravity is excluded).
+    fx = fy = fz = 0.0
+    mx = my = mz = 0.0
+    for k in prange(eulers.shape[0]):
+        R = _euler_axes_to_R(eulers[k], order_axes[orders_int[k]])
+        m = masses[k]
+
+        # Gravity in local load coordinates, acting at the COG
+        g0 = m * (R[0, 0]*gvec[0] + R[1, 0]*gvec[1] + R[2, 0]*gvec[2])
+        g1 = m * (R[0, 1]*gvec[0] + R[1, 1]*gvec[1] + R[2, 1]*gvec[2])
+        g2 = m * (R[0, 2]*gvec[0] + R[1, 2]*gvec[1] + R[2, 2]*gvec[2])
+        c0, c1, c2 = cogs[k, 0], cogs[k, 1], cogs[k, 2]
+        f0 = forces[k, 0] + g0
+        f1 = forces[k, 1] + g1
+        f2 = forces[k, 2] + g2
+        l0 = moments[k, 0] + c1*g2 - c2*g1
+        l1 = moments[k, 1] + c2*g0 - c0*g2
+        l2 = moments[k, 2] + c0*g1 - c1*g0
+
+        # Local to global
+        F0 = R[0, 0]*f0 + R[0, 1]*f1 + R[0, 2]*f2
+        F1 = R[1, 0]*f0 + R[1, 1]*f1 + R[1, 2]*f2
+        F2 = R[2, 0]*f0 + R[2, 1]*f1 + R[2, 2]*f2
+        r0 = translations[k, 0] - target_pos[0]
+        r1 = translations[k, 1] - target_pos[1]
+        r2 = translations[k, 2] - target_pos[2]
+
+        fx += F0
+        fy += F1
+        fz += F2
+        mx += R[0, 0]*l0 + R[0, 1]*l1 + R[0, 2]*l2 + r1*F2 - r2*F1
+        my += R[1, 0]*l0 + R[1, 1]*l1 + R[1, 2]*l2 + r2*F0 - r0*F2
+        mz += R[2, 0]*l0 + R[2, 1]*l1 + R[2, 2]*l2 + r0*F1 - r1*F0
+
+    total_force = _mul33T_v3(R_target, np.array([fx, fy, fz]))
+    total_moment = _mul33T_v3(R_target, np.array([mx, my, mz]))
     return total_force, total_moment
 
+_euler_axes_to_R(np.zeros(3), np.zeros(3, dtype=np.int64))
+_combine_loads_kernel(np.zeros((1, 3)), np.zeros(1, dtype=np.int64), np.zeros((1, 3), dtype=np.int64),
+                      np.zeros((1, 3)), np.zeros((1, 3)), np.zeros((1, 3)), np.zeros(1), np.zeros((1, 3)),
+                      np.eye(3), np.zeros(3), np.zeros(3))
+
+def create_rotation_matrices(euler_angles, rotation_orders):
+    """
+    Batched create_rotation_matrix: euler_angles is (N, 3) in radians and
+    rotation_orders a sequence of N order strings. Returns an (N, 3, 3) stack.
+    With numba the whole batch is built in one parallel pass that evaluates
+    each sin/cos once. Otherwise loads sharing a rotation order are built
+    together, by scipy when it is installed, else with one batched matmul
+    per axis.
+    """
+    euler_angles = np.asarray(euler_angles, dtype=np.float64).reshape(-1, 3)
+    orders = np.array([order.lower() for order in rotation_orders])
+    if _HAS_NUMBA:
+        axes_by_order = {order: [_AXIS_INDEX[axis] for axis in order] for order in set(orders)}
+        axes = np.array([axes_by_order[order] for order in orders], dtype=np.int64).reshape(-1, 3)
+        return _rotation_matrices_kernel(euler_angles, axes)
+    unique_orders, orders_int = np.unique(orders, return_inverse=True)
+    return _rotation_matrices_grouped(euler_angles, unique_orders, orders_int.ravel())
+
+def _rotation_matrices_grouped(euler_angles, orders, orders_int):
+    # Systems with orders[orders_int[k]] built together, one batch per order
+    R = np.empty((len(euler_angles), 3, 3))
+    order_groups = np.split(np.argsort(orders_int, kind='stable'),
+                            np.cumsum(np.bincount(orders_int, minlength=len(orders)))[:-1])
+    for order, idx in zip(orders, order_groups):
+        if len(idx) == 0:
+            continue
+        if Rotation is not None:
+            R[idx] = Rotation.from_euler(order, euler_angles[idx]).as_matrix()
+            continue
+        R_order = _axis_rotation_batch(order[-1], euler_angles[idx, len(order) - 1])
+        for i in range(len(order) - 2, -1, -1):
+            R_order = R_order @ _axis_rotation_batch(order[i], euler_angles[idx, i])
+        R[idx] = R_order
+    return R
+
+# The six orders with distinct axes as int codes, indices into ROTATION_ORDERS,
+# for callers keeping orders as an int array: a code selects its closed-form
+# parameters directly, with no string handling per system
+ROTATION_ORDERS = ('xyz', 'xzy', 'yxz', 'yzx', 'zxy', 'zyx')
+ORDER_CODES = {order: code for code, order in enumerate(ROTATION_ORDERS)}
+_CODE_AXES = np.array([_TAIT_BRYAN[order][0] for order in ROTATION_ORDERS])
+_CODE_SIGNS = np.array([_TAIT_BRYAN[order][1] for order in ROTATION_ORDERS])
+
+@njit(parallel=True, cache=True)
+def _tait_bryan_matrices_kernel(euler_angles, codes, code_axes, code_signs):
+    n = euler_angles.shape[0]
+    R = np.empty((n, 3, 3))
+    for k in prange(n):
+        code = codes[k]
+        R[k] = _tait_bryan_to_R(euler_angles[k], code_axes[code], code_signs[code])
+    return R
+
+def create_rotation_matrices_from_codes(euler_angles, order_codes):
+    """
+    create_rotation_matrices with the orders given as int codes (see
+    ORDER_CODES) in an array of N instead of N strings.
+    """
+    euler_angles = np.asarray(euler_angles, dtype=np.float64).reshape(-1, 3)
+    order_codes = np.asarray(order_codes, dtype=np.int64).reshape(-1)
+    if _HAS_NUMBA:
+        return _tait_bryan_matrices_kernel(euler_angles, order_codes, _CODE_AXES, _CODE_SIGNS)
+    return _rotation_matrices_grouped(euler_angles, ROTATION_ORDERS, order_codes)
+
+def loads_to_soa(loads):
+    """
+    Unpack a list of load dicts into stacked arrays, one pass per field:
+    (eulers, orders, translations, forces, moments, masses, cogs). Missing
+    force/moment/cog default to zero vectors and a missing mass to 0.0.
+    """
+    n = len(loads)
+    eulers = np.array([load['euler_angles'] for load in loads], dtype=np.float64).reshape(n, 3)
+    orders = [load['rotation_order'] for load in loads]
+    translations = np.array([load['translation'] for load in loads], dtype=np.float64).reshape(n, 3)
+    forces = np.array([load.get('force', (0, 0, 0)) for load in loads], dtype=np.float64).reshape(n, 3)
+    moments = np.array([load.get('moment', (0, 0, 0)) for load in loads], dtype=np.float64).reshape(n, 3)
+    masses = np.fromiter((load.get('mass', 0.0) for load in loads), dtype=np.float64, count=n)
+    cogs = np.array([load.get('cog', (0, 0, 0)) for load in loads], dtype=np.float64).reshape(n, 3)
+    return eulers, orders, translations, forces, moments, masses, cogs
+
+def combine_loads_batched(loads, target_system, include_gravity=True, gravity_data=None):
+    """
+    Vectorized version of combine_loads.
+
+    Takes the same arguments and returns the same result, but stacks all loads
+    into (N, 3) arrays and transfers them with a handful of array operations
+    instead of one create_rotation_matrix/rigid_load_transfer call per load.
+    Prefer it when combining many loads.
+    """
+    # Create target system rotation matrix
+    R_target, target_pos = create_rotation_matrix(
+        target_system['euler_angles'],
+        target_system['rotation_order'],
+        target_system['translation']
+    )
+
+    if len(loads) == 0:
+        return np.zeros(3), np.zeros(3)
+
+    # Set default gravity data if not provided
+    if gravity_data is None:
+        gravity_data = {'value': 9.81, 'direction': [0, 0, -1]}
+
+    # Normalize gravity direction
+    gravity_dir = np.asarray(gravity_data.get('direction', [0, 0, -1]), dtype=np.float64)
+    gravity_norm = np.linalg.norm(gravity_dir)
+    if gravity_norm > 0:
+        gravity_dir = gravity_dir / gravity_norm
+    gravity_value = gravity_data.get('value', 9.81)
+
+    # Stack load data, shape (N, 3)
+    eulers, orders, translations, forces, moments, masses, cogs = loads_to_soa(loads)
+
+    if _HAS_NUMBA:
+        # Encode each rotation order as an index into a small table of axis indices
+        unique_orders, orders_int = np.unique([order.lower() for order in orders], return_inverse=True)
+        order_axes = np.array([[_AXIS_INDEX[axis] for axis in order] for order in unique_orders], dtype=np.int64)
+        if include_gravity:
+            np.maximum(masses, 0.0, out=masses)
+            gvec = gravity_value * gravity_dir
+        else:
+            gvec = np.zeros(3)
+        return _combine_loads_kernel(eulers, orders_int.astype(np.int64).ravel(), order_axes, translations,
+                                     forces, moments, masses, cogs, R_target, target_pos, gvec)
+
+    # Source system rotation matrices, shape (N, 3, 3)
+    R_source = create_rotation_matrices(eulers, orders)
+
+    # Add gravity force (and moment about the COG) in local load coordinates.
+    # Loads without a positive mass get zero mass, so they add nothing; the
+    # whole step is skipped when no load has any.
+    if include_gravity and (masses > 0).any():
+        np.maximum(masses, 0.0, out=masses)
+        gravity_force_global = masses[:, None] * (gravity_value * gravity_dir)
+        gravity_force_local = (R_source.swapaxes(-1, -2) @ gravity_force_global[..., None])[..., 0]
+        forces += gravity_force_local
+        moments += np.cross(cogs, gravity_force_local)
+
+    # Transfer all loads to global, then to the target system
+    force_global = (R_source @ forces[..., None])[..., 0]
+    moment_global = (R_source @ moments[..., None])[..., 0]
+    moment_global += np.cross(translations - target_pos, force_global)
+
+    return R_target.T @ force_global.sum(axis=0), R_target.T @ moment_global.sum(axis=0)
+
 # Example usage
 if __name__ == "__main__":
     # Define target system (lc0)
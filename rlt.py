@@ -7,18 +7,40 @@
 
 """
 import dash
-from dash import dcc, html, Input, Output, State, callback, dash_table, ALL
+from dash import dcc, html, Input, Output, State, callback, dash_table, ALL, Patch
+from dash.dash_table.Format import Format, Scheme
 import plotly.graph_objects as go
+import plotly.io as pio
 import numpy as np
 import json
 import base64
 import io
 import os
-import re
+import colorsys
+from functools import lru_cache
+try:
+    from flask_caching import Cache
+except ImportError:
+    # flask_caching is optional, the figure is then memoized in-process
+    Cache = None
+try:
+    import orjson
+except ImportError:
+    # orjson is optional, figures and uploads then go through the json module
+    orjson = None
 # import dash_daq as daq
 import plot_3d as plot3d
 import rigid_load_transfer as rlt
 
+# Serialize figures (and their numpy trace data) with orjson when available
+if orjson is not None:
+    pio.json.config.default_engine = 'orjson'
+# Both accept bytes; the dumps gives a canonical (key sorted) string for caching
+json_loads = orjson.loads if orjson is not None else json.loads
+def json_dumps_sorted(obj):
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True)
 # ---------------------------------------- THEMES ----------------------------------------
 PLOT_THEMES = {
     'default': {
@@ -52,10 +74,18 @@ PLOT_THEMES = {
         'text_color': '#4682B4'
     }
 }
+# Evenly spaced hues for new systems, so consecutive colors stay distinguishable
+_PALETTE = ['#%02x%02x%02x' % tuple(int(255 * c) for c in colorsys.hsv_to_rgb(i / 24, 0.65, 0.9))
+            for i in range(24)]
 # --------------------------------- Initialize Dash app ----------------------------------
 # Initialize Dash app
 app = dash.Dash(__name__, suppress_callback_exceptions=True)
 server = app.server
+if Cache is not None:
+    cache = Cache(server, config={'CACHE_TYPE': 'SimpleCache'})
+    _memoize = cache.memoize(timeout=300)
+else:
+    _memoize = lru_cache(maxsize=32)
 # ---------------------------------------- layout ----------------------------------------
 app.layout = html.Div([
     # html.Div([    
@@ -69,6 +99,9 @@ app.layout = html.Div([
     dcc.Store(id='loads-store', data=[]),
     dcc.Store(id='targets-store', data=[]),
     dcc.Store(id='gravity-store', data={'value': 9.81, 'direction': [0, 0, -1]}),
+    dcc.Store(id='input-counts', data=None),
+    # Whether the current systems were loaded from a graph (nodes/edges) file
+    dcc.Store(id='from-graph-store', data=False),
     dcc.Download(id="download-data"),
     dcc.Download(id="download-plot-html"),
     html.Div([
@@ -93,17 +126,17 @@ app.layout = html.Div([
                 html.H4("Gravity Settings", style={'marginBottom': '5px'}),
                 html.Div([
                     html.Label("Gravity Value (m/s²):"),
-                    dcc.Input(id='gravity-value', type='number', value=9.81, style={'width': '80px'})
+                    dcc.Input(id='gravity-value', type='number', debounce=True, value=9.81, style={'width': '80px'})
                 ], style={'marginBottom': '5px'}),
                 html.Div([
                     html.Label("Gravity Direction (X,Y,Z):"),
-                    dcc.Input(id='gravity-x', type='number', value=0, style={'width': '50px'}),
-                    dcc.Input(id='gravity-y', type='number', value=0, style={'width': '50px'}),
-                    dcc.Input(id='gravity-z', type='number', value=-1, style={'width': '50px'})
+                    dcc.Input(id='gravity-x', type='number', debounce=True, value=0, style={'width': '50px'}),
+                    dcc.Input(id='gravity-y', type='number', debounce=True, value=0, style={'width': '50px'}),
+                    dcc.Input(id='gravity-z', type='number', debounce=True, value=-1, style={'width': '50px'})
                 ], style={'display': 'flex', 'alignItems': 'center', 'gap': '5px', 'marginBottom': '10px'})
             ], style={'padding': '10px', 'backgroundColor': '#f5f5f5', 'borderRadius': '5px', 'marginBottom': '10px'}),
                        
-            html.Button('➕ Add Load System', id='add-load-btn', n_clicks=0, style={
+            html.Button('➕ Add Load System', id={'type': 'add-btn', 'kind': 'load'}, n_clicks=0, style={
                 'width': '100%', 
                 'backgroundColor': '#27ae60', 
                 'color': 'white',
@@ -116,7 +149,7 @@ app.layout = html.Div([
             html.Div(id='load-inputs-container', style={'marginTop': '10px'}),
             html.Hr(style={'border': '1px solid #ccc'}),
 
-            html.Button('➕ Add Target System', id='add-target-btn', n_clicks=0, style={
+            html.Button('➕ Add Target System', id={'type': 'add-btn', 'kind': 'target'}, n_clicks=0, style={
                 'width': '100%', 
                 'backgroundColor': '#e67e22', 
                 'color': 'white',
@@ -233,46 +266,58 @@ app.layout = html.Div([
 ])
 
 
-# Function to format JSON with compact arrays
-def format_json_compact_arrays(json_str):
+# Function to serialize JSON with compact arrays
+def dump_json_compact_arrays(obj, indent=0):
     """
-    Formats JSON string to make arrays more compact and readable.
+    Serializes an object to an indented JSON string with compact arrays.
     
     Args:
-        json_str (str): JSON string to format
+        obj: JSON-serializable object (dicts, lists and scalars)
+        indent (int): Current indentation level, in spaces
         
     Returns:
-        str: Formatted JSON string with compact arrays
-        
-    The function:
-    1. Identifies array patterns in the JSON
-    2. Compacts multi-line arrays into single lines
-    3. Preserves proper indentation for objects
+        str: JSON string with objects indented by 2 spaces and arrays of
+             scalars written on a single line
     """
-    # Use regex to find arrays and compact them
-    # This pattern looks for array patterns with newlines and extra spaces
-    pattern = r'\[\s*\n\s*([^][]*?)\s*\n\s*\]'
-    
-    # Function to process each match
-    def compact_array(match):
-        # Get the content of the array
-        content = match.group(1)
-        # Split by comma and newline, then clean each element
-        elements = re.split(r',\s*\n\s*', content)
-        elements = [elem.strip() for elem in elements]
-        # Rejoin with comma and space
-        return f"[{', '.join(elements)}]"
-    
-    # Apply the pattern repeatedly until no more changes
-    prev_json = ""
-    while prev_json != json_str:
-        prev_json = json_str
-        json_str = re.sub(pattern, compact_array, json_str, flags=re.DOTALL)
-    
-    return json_str
+    pad = ' ' * (indent + 2)
+    if isinstance(obj, dict):
+        if not obj:
+            return '{}'
+        items = [pad + json.dumps(str(key)) + ': ' + dump_json_compact_arrays(value, indent + 2)
+                 for key, value in obj.items()]
+        return '{\n' + ',\n'.join(items) + '\n' + ' ' * indent + '}'
+    if isinstance(obj, (list, tuple)):
+        if all(not isinstance(value, (dict, list, tuple)) for value in obj):
+            return '[' + ', '.join(json.dumps(value) for value in obj) + ']'
+        items = [pad + dump_json_compact_arrays(value, indent + 2) for value in obj]
+        return '[\n' + ',\n'.join(items) + '\n' + ' ' * indent + ']'
+    return json.dumps(obj)
+# Store fields edited through three inputs (x, y, z) or through a single one
+_VEC_FIELDS = {
+    'translation': ('tx', 'ty', 'tz'),
+    'euler_angles': ('rx', 'ry', 'rz'),
+    'force': ('fx', 'fy', 'fz'),
+    'moment': ('mx', 'my', 'mz'),
+    'cog': ('cog-x', 'cog-y', 'cog-z')
+}
+_SCALAR_FIELDS = {'name': 'name', 'mass': 'mass', 'rot-order': 'rotation_order'}
+
+# Store field (and vector component) written by each input type
+_INPUT_FIELDS = {input_type: (field, None) for input_type, field in _SCALAR_FIELDS.items()}
+_INPUT_FIELDS.update({input_type: (field, component)
+                      for field, input_types in _VEC_FIELDS.items()
+                      for component, input_type in enumerate(input_types)})
+
 # ---------------------------------------- Callbacks ----------------------------------------
-# Callback for gravity settings
-@app.callback(
+# Callback for gravity settings, normalized in the browser to save a round trip
+app.clientside_callback(
+    """
+    function(value, x, y, z) {
+        const n = Math.hypot(x || 0, y || 0, z || 0);
+        const direction = n > 0 ? [(x || 0) / n, (y || 0) / n, (z || 0) / n] : [0, 0, -1];
+        return {value: value == null ? 9.81 : value, direction: direction};
+    }
+    """,
     Output('gravity-store', 'data'),
     [Input('gravity-value', 'value'),
      Input('gravity-x', 'value'),
@@ -280,63 +325,60 @@ def format_json_compact_arrays(json_str):
      Input('gravity-z', 'value')],
     prevent_initial_call=True
 )
-def update_gravity_settings(gravity_value, gx, gy, gz):
-    # Normalize direction vector
-    direction = np.array([gx, gy, gz])
-    norm = np.linalg.norm(direction)
-    if norm > 0:
-        direction = direction / norm
-    
-    return {
-        'value': gravity_value if gravity_value is not None else 9.81,
-        'direction': direction.tolist()
-    }
 
-# Callbacks for adding systems
-@app.callback(
-    Output('loads-store', 'data'),
-    Input('add-load-btn', 'n_clicks'),
-    State('loads-store', 'data'),
-    prevent_initial_call=True
-)
-def add_load_system(n_clicks, data):
-    new_load = {
-        'name': f'Load System {len(data) + 1}',  # Default name
-        'force': [0.0, 0.0, 0.0],
-        'moment': [0.0, 0.0, 0.0],
-        'euler_angles': [0.0, 0.0, 0.0],
-        'rotation_order': 'xyz',
-        'translation': [0.0, 0.0, 0.0],
-        'color': {'hex': f'#{np.random.randint(0, 0xFFFFFF):06x}'},
-        'mass': 0.0,
-        'cog': [0.0, 0.0, 0.0]
-    }
-    return data + [new_load]
+# Default fields of newly added systems, name and color are filled in per system
+_LOAD_TEMPLATE = {
+    'force': [0.0, 0.0, 0.0],
+    'moment': [0.0, 0.0, 0.0],
+    'euler_angles': [0.0, 0.0, 0.0],
+    'rotation_order': 'xyz',
+    'translation': [0.0, 0.0, 0.0],
+    'mass': 0.0,
+    'cog': [0.0, 0.0, 0.0]
+}
+_TARGET_TEMPLATE = {
+    'euler_angles': [0.0, 0.0, 0.0],
+    'rotation_order': 'xyz',
+    'translation': [0.0, 0.0, 0.0]
+}
 
+# Callback for adding systems, shared by both add buttons
 @app.callback(
-    Output('targets-store', 'data'),
-    Input('add-target-btn', 'n_clicks'),
-    State('targets-store', 'data'),
+    [Output('loads-store', 'data'),
+     Output('targets-store', 'data')],
+    Input({'type': 'add-btn', 'kind': ALL}, 'n_clicks'),
+    [State('loads-store', 'data'),
+     State('targets-store', 'data')],
     prevent_initial_call=True
 )
-def add_target_system(n_clicks, data):
-    new_target = {
-        'name': f'Target System {len(data) + 1}',  # Default name
-        'euler_angles': [0.0, 0.0, 0.0],
-        'rotation_order': 'xyz',
-        'translation': [0.0, 0.0, 0.0],
-        'color': {'hex': f'#{np.random.randint(0, 0xFFFFFF):06x}'}
-    }
-    return data + [new_target]
+def add_system(n_clicks, loads, targets):
+    kind = dash.callback_context.triggered_id['kind']
+    data, template = (loads, _LOAD_TEMPLATE) if kind == 'load' else (targets, _TARGET_TEMPLATE)
+    new_system = dict(template,
+                      name=f'{kind.capitalize()} System {len(data) + 1}',  # Default name
+                      color={'hex': _PALETTE[len(data) % len(_PALETTE)]})
+
+    # Append to the store in place instead of sending the whole list back
+    patch = Patch()
+    patch.append(new_system)
+    return [patch, dash.no_update] if kind == 'load' else [dash.no_update, patch]
 
 # Input components callback
 @app.callback(
     [Output('load-inputs-container', 'children'),
-     Output('target-inputs-container', 'children')],
+     Output('target-inputs-container', 'children'),
+     Output('input-counts', 'data')],
     [Input('loads-store', 'data'),
-     Input('targets-store', 'data')]
+     Input('targets-store', 'data')],
+    State('input-counts', 'data')
 )
-def update_input_components(loads, targets):
+def update_input_components(loads, targets, counts):
+    # Edits made through the inputs only change values they already show, so the
+    # controls are rebuilt only when systems are added or the stores are replaced
+    new_counts = [len(loads), len(targets)]
+    if counts == new_counts:
+        return dash.no_update, dash.no_update, dash.no_update
+
     def create_controls(items, input_type):
         controls = []
         for i, item in enumerate(items):
@@ -346,101 +388,117 @@ def update_input_components(loads, targets):
 
             system_color = item['color']['hex']
 
-            controls.append(
-                    html.Div([
-                    html.H5(f"{input_type.capitalize()} System {i+1}"),
-                    html.Div([
-                        html.Label("System Name:"),
-                        dcc.Input(
-                            value=item.get('name', f'{input_type.capitalize()} System {i+1}'),
-                            type='text',
-                            id={'type': 'name', 'index': i, 'input-type': input_type},
-                            style={'width': '200px'})
-                    ], style={'marginBottom': '10px'}),
-                        
-                    html.Div([
-                        html.Label("Position(X,Y,Z):"),
-                        dcc.Input(value=item['translation'][0], type='number',
-                                 id={'type': 'tx', 'index': i, 'input-type': input_type},style={'width': '50px'}),
-                        dcc.Input(value=item['translation'][1], type='number',
-                                 id={'type': 'ty', 'index': i, 'input-type': input_type},style={'width': '50px'}),
-                        dcc.Input(value=item['translation'][2], type='number',
-                                 id={'type': 'tz', 'index': i, 'input-type': input_type},style={'width': '50px'}),
-                    ], className='input-group',style={'display': 'flex', 'alignItems': 'center', 'gap': '5px'}),
-                    # html.Hr(),
+            # Look up each field once per system
+            label = input_type.capitalize()
+            name = item.get('name', f'{label} System {i+1}')
+            trans = item['translation']
+            eul = item['euler_angles']
+            force = item.get('force', [0,0,0])
+            moment = item.get('moment', [0,0,0])
+            mass = item.get('mass', 0)
+            cog = item.get('cog', [0,0,0])
+
+            # Controls shared by load and target systems
+            system_controls = [
+                html.H5(f"{label} System {i+1}"),
+                html.Div([
+                    html.Label("System Name:"),
+                    dcc.Input(
+                        value=name,
+                        type='text',
+                        id={'type': 'name', 'index': i, 'input-type': input_type},
+                        style={'width': '200px'})
+                ], style={'marginBottom': '10px'}),
+                    
+                html.Div([
+                    html.Label("Position(X,Y,Z):"),
+                    dcc.Input(value=trans[0], type='number', debounce=True,
+                             id={'type': 'tx', 'index': i, 'input-type': input_type},style={'width': '50px'}),
+                    dcc.Input(value=trans[1], type='number', debounce=True,
+                             id={'type': 'ty', 'index': i, 'input-type': input_type},style={'width': '50px'}),
+                    dcc.Input(value=trans[2], type='number', debounce=True,
+                             id={'type': 'tz', 'index': i, 'input-type': input_type},style={'width': '50px'}),
+                ], className='input-group',style={'display': 'flex', 'alignItems': 'center', 'gap': '5px'}),
+                # html.Hr(),
+                html.Div([
+                    # Rotation order with inline label and dropdown
                     html.Div([
-                        # Rotation order with inline label and dropdown
-                        html.Div([
-                            html.Label("Rotation Order:", style={'minWidth': '100px'}),
-                            dcc.Dropdown(
-                                options=['xyz', 'xzy', 'yxz', 'yzx', 'zxy', 'zyx'],
-                                value=item['rotation_order'],
-                                id={'type': 'rot-order', 'index': i, 'input-type': input_type},
-                                style={'width': '120px'}
-                            )
-                        ], style={'display': 'flex', 'alignItems': 'center', 'gap': '10px'})
-                    ], className='input-group', style={'flex': '1'}),
-                        
+                        html.Label("Rotation Order:", style={'minWidth': '100px'}),
+                        dcc.Dropdown(
+                            options=['xyz', 'xzy', 'yxz', 'yzx', 'zxy', 'zyx'],
+                            value=item['rotation_order'],
+                            id={'type': 'rot-order', 'index': i, 'input-type': input_type},
+                            style={'width': '120px'}
+                        )
+                    ], style={'display': 'flex', 'alignItems': 'center', 'gap': '10px'})
+                ], className='input-group', style={'flex': '1'}),
+                    
+                html.Div([
+                    # Rotation degrees with inline label and inputs
                     html.Div([
-                        # Rotation degrees with inline label and inputs
-                        html.Div([
-                            html.Label("Rotation (deg):", style={'minWidth': '100px'}),
-                            html.Div([  # Container for inputs
-                                dcc.Input(value=np.array(item['euler_angles'][0]), type='number',
-                                         id={'type': 'rx', 'index': i, 'input-type': input_type},style={'width': '50px'}),
-                                dcc.Input(value=np.array(item['euler_angles'][1]), type='number',
-                                         id={'type': 'ry', 'index': i, 'input-type': input_type},style={'width': '50px'}),
-                                dcc.Input(value=np.array(item['euler_angles'][2]), type='number',
-                                         id={'type': 'rz', 'index': i, 'input-type': input_type},style={'width': '50px'}),
-                            ], style={'display': 'flex', 'gap': '5px'})
-                        ], style={'display': 'flex', 'alignItems': 'center', 'gap': '10px'})
-                    ], className='input-group', style={'flex': '1'}),
-                    html.Hr(),
-                        
+                        html.Label("Rotation (deg):", style={'minWidth': '100px'}),
+                        html.Div([  # Container for inputs
+                            dcc.Input(value=eul[0], type='number', debounce=True,
+                                     id={'type': 'rx', 'index': i, 'input-type': input_type},style={'width': '50px'}),
+                            dcc.Input(value=eul[1], type='number', debounce=True,
+                                     id={'type': 'ry', 'index': i, 'input-type': input_type},style={'width': '50px'}),
+                            dcc.Input(value=eul[2], type='number', debounce=True,
+                                     id={'type': 'rz', 'index': i, 'input-type': input_type},style={'width': '50px'}),
+                        ], style={'display': 'flex', 'gap': '5px'})
+                    ], style={'display': 'flex', 'alignItems': 'center', 'gap': '10px'})
+                ], className='input-group', style={'flex': '1'}),
+                html.Hr(),
+            ]
+
+            # Force, moment, mass and COG only apply to load systems
+            if input_type == 'load':
+                system_controls.extend([
                     html.Div([
                         html.Label("Force L(X,Y,Z):"),
-                        dcc.Input(value=item.get('force', [0,0,0])[0], type='number',
+                        dcc.Input(value=force[0], type='number', debounce=True,
                                  id={'type': 'fx', 'index': i, 'input-type': input_type}, style={'width': '50px'}),
-                        dcc.Input(value=item.get('force', [0,0,0])[1], type='number',
+                        dcc.Input(value=force[1], type='number', debounce=True,
                                  id={'type': 'fy', 'index': i, 'input-type': input_type}, style={'width': '50px'}),
-                        dcc.Input(value=item.get('force', [0,0,0])[2], type='number',
+                        dcc.Input(value=force[2], type='number', debounce=True,
                                  id={'type': 'fz', 'index': i, 'input-type': input_type}, style={'width': '50px'}),
-                    ], className='input-group', style={'display': 'flex', 'alignItems': 'center', 'gap': '5px'}) if input_type == 'load' else html.Div(hidden=True),
-                        
+                    ], className='input-group', style={'display': 'flex', 'alignItems': 'center', 'gap': '5px'}),
+                    
                     html.Div([
                         html.Label("Moment L(X,Y,Z):"),
-                        dcc.Input(value=item.get('moment', [0,0,0])[0], type='number',
+                        dcc.Input(value=moment[0], type='number', debounce=True,
                                  id={'type': 'mx', 'index': i, 'input-type': input_type},style={'width': '50px'}),
-                        dcc.Input(value=item.get('moment', [0,0,0])[1], type='number',
+                        dcc.Input(value=moment[1], type='number', debounce=True,
                                  id={'type': 'my', 'index': i, 'input-type': input_type},style={'width': '50px'}),
-                        dcc.Input(value=item.get('moment', [0,0,0])[2], type='number',
+                        dcc.Input(value=moment[2], type='number', debounce=True,
                                  id={'type': 'mz', 'index': i, 'input-type': input_type},style={'width': '50px'}),
-                    ], className='input-group', style={'display': 'flex', 'alignItems': 'center', 'gap': '5px'}) if input_type == 'load' else html.Div(hidden=True),
+                    ], className='input-group', style={'display': 'flex', 'alignItems': 'center', 'gap': '5px'}),
                     html.Hr(),
-                   # Mass and COG inputs for load systems
+                    # Mass and COG inputs for load systems
                     html.Div([
                         html.Div([
                             html.Label("Mass (kg):"),
-                            dcc.Input(value=item.get('mass', 0), type='number',
+                            dcc.Input(value=mass, type='number', debounce=True,
                                      id={'type': 'mass', 'index': i, 'input-type': input_type},
                                      style={'width': '80px'})
                         ], style={'marginBottom': '5px'}),
 
                         html.Div([
                             html.Label("CoG L(X,Y,Z):"),
-                            dcc.Input(value=item.get('cog', [0,0,0])[0], type='number',
+                            dcc.Input(value=cog[0], type='number', debounce=True,
                                      id={'type': 'cog-x', 'index': i, 'input-type': input_type},
                                      style={'width': '50px'}),
-                            dcc.Input(value=item.get('cog', [0,0,0])[1], type='number',
+                            dcc.Input(value=cog[1], type='number', debounce=True,
                                      id={'type': 'cog-y', 'index': i, 'input-type': input_type},
                                      style={'width': '50px'}),
-                            dcc.Input(value=item.get('cog', [0,0,0])[2], type='number',
+                            dcc.Input(value=cog[2], type='number', debounce=True,
                                      id={'type': 'cog-z', 'index': i, 'input-type': input_type},
                                      style={'width': '50px'})
                         ], style={'display': 'flex', 'alignItems': 'center', 'gap': '5px'})
-                    ], style={'marginBottom': '10px'}) if input_type == 'load' else html.Div(hidden=True),
+                    ], style={'marginBottom': '10px'})
+                ])
 
-                ], style={
+            controls.append(
+                html.Div(system_controls, style={
                     'border': f'2px solid {system_color}',
                     'borderRadius': '8px',
                     'padding': '8px',
@@ -450,7 +508,7 @@ def update_input_components(loads, targets):
             )
         return controls
 
-    return create_controls(loads, 'load'), create_controls(targets, 'target')
+    return create_controls(loads, 'load'), create_controls(targets, 'target'), new_counts
 # Input updates callback
 
 @app.callback(
@@ -485,158 +543,131 @@ def update_stores(name, tx, ty, tz, rx, ry, rz,
                  loads, targets):
     ctx = dash.callback_context
     if not ctx.triggered:
-        return loads, targets
+        return dash.no_update, dash.no_update
 
-    # Create dictionaries to store all input values by their type and index
-    input_values = {'load': {}, 'target': {}}
+    # Only the triggered fields are sent back, as partial store updates
+    stores = {'load': loads, 'target': targets}
+    patches = {'load': Patch(), 'target': Patch()}
+    changed = set()
 
-    # Get the triggered input info
-    triggered = [t['prop_id'] for t in ctx.triggered]
-    
-    # Process all inputs
-    for trigger_idx, trigger in enumerate(triggered):
-        # Parse the triggered component ID
-        if '.' in trigger:  # Ensure it's a valid trigger
-            component_id = trigger.split('.')[0]
-            try:
-                parsed_id = eval(component_id)
-                input_type = parsed_id['input-type']
-                index = parsed_id['index']
-                value_type = parsed_id['type']
-                
-                # Initialize nested dictionaries if they don't exist
-                if index not in input_values[input_type]:
-                    input_values[input_type][index] = {}
-                
-                # Get the corresponding value from the triggered input
-                value = ctx.triggered[trigger_idx]['value']
-                # # Handle null/empty values for numeric inputs
-                # if value_type in ['tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'fx', 'fy', 'fz', 'mx', 'my', 'mz']:
-                    # value = 0.0 if value is None or value == '' else float(value)
-                # input_values[input_type][index][value_type] = value
-                input_values[input_type][index][value_type] = value
-                
-            except Exception as e:
-                print(f"Error processing trigger {trigger}: {e}")
-                continue
+    # Walk the structured inputs, pattern-matching IDs arrive already parsed
+    triggered = [entry for group in ctx.args_grouping if isinstance(group, list)
+                 for entry in group if entry.get('triggered')]
+    for entry in triggered:
+        parsed_id = entry['id']
+        try:
+            input_type = parsed_id['input-type']
+            index = parsed_id['index']
+            field, component = _INPUT_FIELDS[parsed_id['type']]
+            item = stores[input_type][index]
+        except (KeyError, IndexError) as e:
+            print(f"Error processing trigger {parsed_id}: {e}")
+            continue
 
-    # Update loads
-    for i in range(len(loads)):
-        if i in input_values.get('load', {}):
-            vals = input_values['load'][i]
-            
-            if 'name' in vals:
-                loads[i]['name'] = vals['name']            
-            # Update translation
-            if any(k in vals for k in ['tx', 'ty', 'tz']):
-                loads[i]['translation'] = [
-                    vals.get('tx', loads[i]['translation'][0]),
-                    vals.get('ty', loads[i]['translation'][1]),
-                    vals.get('tz', loads[i]['translation'][2])
-                ]
-            
-            # Update rotation angles
-            if any(k in vals for k in ['rx', 'ry', 'rz']):
-                loads[i]['euler_angles'] = np.array([
-                    vals.get('rx', loads[i]['euler_angles'][0]),
-                    vals.get('ry', loads[i]['euler_angles'][1]),
-                    vals.get('rz', loads[i]['euler_angles'][2])
-                ]).tolist()
-            
-            # Update force
-            if any(k in vals for k in ['fx', 'fy', 'fz']):
-                loads[i]['force'] = [
-                    vals.get('fx', loads[i]['force'][0]),
-                    vals.get('fy', loads[i]['force'][1]),
-                    vals.get('fz', loads[i]['force'][2])
-                ]
-            
-            # Update moment
-            if any(k in vals for k in ['mx', 'my', 'mz']):
-                loads[i]['moment'] = [
-                    vals.get('mx', loads[i]['moment'][0]),
-                    vals.get('my', loads[i]['moment'][1]),
-                    vals.get('mz', loads[i]['moment'][2])
-                ]
-            
-            # Update mass
-            if 'mass' in vals:
-                loads[i]['mass'] = vals['mass']
-                
-            # Update center of gravity
-            if any(k in vals for k in ['cog-x', 'cog-y', 'cog-z']):
-                loads[i]['cog'] = [
-                    vals.get('cog-x', loads[i].get('cog', [0,0,0])[0]),
-                    vals.get('cog-y', loads[i].get('cog', [0,0,0])[1]),
-                    vals.get('cog-z', loads[i].get('cog', [0,0,0])[2])
-                ]
-            
-            # Update rotation order
-            if 'rot-order' in vals:
-                loads[i]['rotation_order'] = vals['rot-order']
+        value = entry['value']
+        if component is not None:
+            # Vector components are plain floats, an emptied field counts as 0
+            value = float(value or 0.0)
 
-    # Update targets
-    for i in range(len(targets)):
-        if i in input_values.get('target', {}):
-            vals = input_values['target'][i]
-            if 'name' in vals:
-                targets[i]['name'] = vals['name']       
-            # Update translation
-            if any(k in vals for k in ['tx', 'ty', 'tz']):
-                targets[i]['translation'] = [
-                    vals.get('tx', targets[i]['translation'][0]),
-                    vals.get('ty', targets[i]['translation'][1]),
-                    vals.get('tz', targets[i]['translation'][2])
-                ]
-            
-            # Update rotation angles
-            if any(k in vals for k in ['rx', 'ry', 'rz']):
-                targets[i]['euler_angles'] = np.array([
-                    vals.get('rx', targets[i]['euler_angles'][0]),
-                    vals.get('ry', targets[i]['euler_angles'][1]),
-                    vals.get('rz', targets[i]['euler_angles'][2])
-                ]).tolist()
-            
-            # Update rotation order
-            if 'rot-order' in vals:
-                targets[i]['rotation_order'] = vals['rot-order']
+        if component is None:
+            patches[input_type][index][field] = value
+        elif field in item:
+            patches[input_type][index][field][component] = value
+        else:
+            # Older stores may lack the field (e.g. cog), write the whole vector
+            vector = [0.0, 0.0, 0.0]
+            vector[component] = value
+            patches[input_type][index][field] = vector
+            item[field] = vector
+        changed.add(input_type)
 
-    return loads, targets
-# Visualization callback
-@app.callback(
-    [Output('3d-plot', 'figure'),
-     Output('results-container', 'children')],
-    [Input('loads-store', 'data'),
-     Input('targets-store', 'data'),
-     Input('gravity-store', 'data'),
-     Input('theme-selector', 'value')]
-)
-def update_visualization(loads, 
-                         targets,
-                         gravity,
-                         theme):
-    fig = go.Figure()
+    return [patches[input_type] if input_type in changed else dash.no_update
+            for input_type in ('load', 'target')]
+# Figure and results only depend on the store contents, so they are cached on
+# their JSON; the memoized result is a plain figure dict
+@_memoize
+def _build_figure(loads_json, targets_json, gravity_json, theme):
+    loads = json_loads(loads_json)
+    targets = json_loads(targets_json)
+    gravity = json_loads(gravity_json)
+    # Traces are collected here and turned into a figure once at the end
+    traces = []
     results = []
     theme_colors = PLOT_THEMES[theme]
     # Add global system
-    fig.add_trace(go.Scatter3d(x=[0], y=[0], z=[0], mode='markers',
+    traces.append(go.Scatter3d(x=[0], y=[0], z=[0], mode='markers',
                               marker=dict(size=4, color='black'), name='Global'))
 
     # Add gravity vector
     gravity_value = gravity.get('value', 9.81)
     gravity_dir = np.array(gravity.get('direction', [0, 0, -1]))
-    gravity_vec = gravity_value * gravity_dir
     
     # Add gravity vector to plot
-    fig.add_trace(go.Scatter3d(
-        x=[0, gravity_dir[0]], 
-        y=[0, gravity_dir[1]], 
-        z=[0, gravity_dir[2]],
+    gravity_xyz = np.array([[0, 0, 0], gravity_dir], dtype=np.float32)
+    traces.append(go.Scatter3d(
+        x=gravity_xyz[:, 0],
+        y=gravity_xyz[:, 1],
+        z=gravity_xyz[:, 2],
         mode='lines',
         line=dict(color='purple', width=5),
+        hoverinfo='skip',
         name=f'Gravity: {gravity_value} m/s²'
     ))
 
+    # Stack load data once, shape (N, 3), and transform all loads to global in a batch
+    load_eulers_rad = load_R = load_pos = load_sums = cog_points = None
+    try:
+        if loads:
+            load_eulers, load_orders, load_pos, forces, moments, masses, cogs = rlt.loads_to_soa(loads)
+            load_eulers_rad = np.radians(load_eulers)
+            load_R = rlt.create_rotation_matrices(load_eulers_rad, load_orders)
+
+            # Force and moment vectors in global coordinates, as drawn
+            force_vectors = (load_R @ forces[..., None])[..., 0]
+            moment_vectors = (load_R @ moments[..., None])[..., 0]
+
+            # Gravity only acts on loads with a positive mass, skip it when none has one
+            has_mass = masses > 0
+            if has_mass.any():
+                gravity_forces = np.where(has_mass, masses, 0.0)[:, None] * (gravity_value * gravity_dir)
+                forces_global = force_vectors + gravity_forces
+                moments_global = moment_vectors + (load_R @ np.cross(cogs, gravity_forces)[..., None])[..., 0]
+                # Global COG positions where the gravity arrows are drawn
+                cog_points = load_pos + (load_R @ cogs[..., None])[..., 0]
+            else:
+                forces_global, moments_global = force_vectors, moment_vectors
+
+            # Sums needed to transfer all loads to any target: F, M and r x F
+            load_sums = (forces_global.sum(axis=0),
+                         moments_global.sum(axis=0),
+                         np.cross(load_pos, forces_global).sum(axis=0))
+            if not all(np.isfinite(total).all() for total in load_sums):
+                load_sums = None
+                raise ValueError("incomplete load values")
+    except Exception as e:
+        print(f"Error processing loads: {e}")
+
+    # Build all target rotations in one batch as well, and transfer the summed
+    # loads to every target at once, shape (T, 3)
+    target_eulers_rad = target_R = target_pos = target_F = target_M = None
+    try:
+        if targets:
+            target_eulers_rad = np.radians(np.array([target['euler_angles'] for target in targets], dtype=float))
+            target_R = rlt.create_rotation_matrices(target_eulers_rad, [target['rotation_order'] for target in targets])
+            target_pos = np.array([target['translation'] for target in targets], dtype=float)
+
+            sum_F, sum_M, sum_rxF = load_sums if loads else (np.zeros(3),) * 3
+            target_F = target_R.swapaxes(-1, -2) @ sum_F
+            target_M = (target_R.swapaxes(-1, -2) @ (sum_M + sum_rxF - np.cross(target_pos, sum_F))[..., None])[..., 0]
+    except Exception as e:
+        print(f"Error processing targets: {e}")
+
+    # Connection lines and gravity arrows are drawn as one trace per category,
+    # their segments are collected as (start, end, color) here
+    connection_segments = []
+    gravity_segments = []
+    gravity_text = []
+
     # Process loads
     for i, load in enumerate(loads):
         try:
@@ -644,60 +675,48 @@ def update_visualization(loads,
             if isinstance(load['color'], str):  # Handle legacy format
                 load['color'] = {'hex': load['color']}
 
-            R, pos = rlt.create_rotation_matrix(
-                np.radians(load['euler_angles']),
-                # np.array(load['euler_angles']),
-                load['rotation_order'],
-                load['translation']
-            )
+            R, pos = load_R[i], load_pos[i]
             color = load['color']['hex']
 
             # Add coordinate system
-            fig_load = plot3d.plot_triad(np.radians(load['euler_angles']), 
+            fig_load = plot3d.plot_triad(load_eulers_rad[i], 
                                          load['rotation_order'],
                                          load['translation'], 
                                          tip_size = 0.5, len_triad = 1,colors_arr = color,
-                                         triad_name = f"{load_name}:InputCSYS", legendgroup= f'group{i}')
-            fig = go.Figure(data = fig.data + fig_load.data)
+                                         triad_name = f"{load_name}:InputCSYS", legendgroup= f'group{i}',
+                                         rotation_matrix = R)
+            traces.extend(fig_load.data)
             # fig.add_traces(create_triad(pos, R, color))
 
             # Add vectors
             if 'force' in load:
-                fig_force = plot3d.create_vector(pos, R @ load['force'], color, f'Force:{load["force"]}', legendgroup= f'force_group{i}',triad_name = f"{load_name}:Force")
-                fig = go.Figure(data = fig.data + fig_force.data)
+                fig_force = plot3d.create_vector(pos, force_vectors[i], color, f'Force:{load["force"]}', legendgroup= f'force_group{i}',triad_name = f"{load_name}:Force")
+                traces.extend(fig_force.data)
             if 'moment' in load:
                 # fig.add_trace(create_vector(pos, R @ load['moment'], color, f'Load {i+1} Moment'))
-                fig_mom  = plot3d.create_vector(pos, R @ load['moment'], color, f'Moment:{load["moment"]}', legendgroup= f'force_group{i}',triad_name = f"{load_name}:Moment")
-                fig = go.Figure(data = fig.data + fig_mom.data)
+                fig_mom  = plot3d.create_vector(pos, moment_vectors[i], color, f'Moment:{load["moment"]}', legendgroup= f'force_group{i}',triad_name = f"{load_name}:Moment")
+                traces.extend(fig_mom.data)
             
             # Add gravity force vector to plot at COG position
             if 'mass' in load and load['mass'] > 0:
-                                    # Get center of gravity or use load position if not specified
-                cog = np.array(load.get('cog', [0, 0, 0]))
-                if np.all(cog == 0):  # If COG is not specified, use load position
-                    cog = load['translation']
-                else:
-                    # COG is specified relative to load coordinate system, transform to global
-                    cog = load['translation'] + R @ cog
-
-                fig.add_trace(go.Scatter3d(
-                    x=[cog[0], cog[0] + gravity_dir[0]],
-                    y=[cog[1], cog[1] + gravity_dir[1]],
-                    z=[cog[2], cog[2] + gravity_dir[2]],
-                    mode='lines',
-                    line=dict(color=color, width=3, dash='dot'),
-                    name=f'{load_name}: Gravity Force ({load["mass"]} kg)'
-                ))
+                # COG is specified relative to load coordinate system, the
+                # load position when not given
+                cog = cog_points[i]
+                gravity_segments.append((cog, cog + gravity_dir, color))
+                gravity_text.append(f'{load_name}: Gravity Force ({load["mass"]} kg)')
 
             # Add connection lines to all targets
-            for j, target in enumerate(targets):
-                # Create a slightly lighter version of the load color for the connection line
-                line_color = color  # You can also create a lighter shade if desired  
-                # Add connection line
-                fig.add_trace(plot3d.create_connection_line(load['translation'],target['translation'],line_color))
+            if targets:
+                connection_segments.extend((pos, end_point, color) for end_point in target_pos)
         except Exception as e:
             print(f"Error processing load {i}: {e}")
 
+    if gravity_segments:
+        traces.append(plot3d.create_line_segments(*zip(*gravity_segments), name='Gravity Forces',
+                                                  width=3, text=gravity_text))
+    if connection_segments:
+        traces.append(plot3d.create_line_segments(*zip(*connection_segments)))
+
     # Process targets
     for i, target in enumerate(targets):
         try:
@@ -705,76 +724,36 @@ def update_visualization(loads,
             if isinstance(target['color'], str):  # Handle legacy format
                 target['color'] = {'hex': target['color']}
             # target_name = load.get('name', f'Load System {i+1}')
-            R_target, pos_target = rlt.create_rotation_matrix(
-                np.radians(target['euler_angles']),
-                # np.array(target['euler_angles']),
-                target['rotation_order'],
-                target['translation']
-            )
             color = target['color']['hex']
 
             # Add coordinate system
-            fig_load = plot3d.plot_triad(np.radians(target['euler_angles']), 
+            fig_load = plot3d.plot_triad(target_eulers_rad[i], 
                                          target['rotation_order'],
                                          target['translation'], 
                                          tip_size = 0.5, len_triad = 1,colors_arr = color,
-                                         triad_name = f"{target_name}:OutCSYS", legendgroup= f'Out_group{i}')
-            fig = go.Figure(data = fig.data + fig_load.data)
+                                         triad_name = f"{target_name}:OutCSYS", legendgroup= f'Out_group{i}',
+                                         rotation_matrix = target_R[i])
+            traces.extend(fig_load.data)
             
             # fig.add_traces(create_triad(pos_target, R_target, color))
 
-            # Calculate results
-            total_F, total_M = np.zeros(3), np.zeros(3)
-            for load in loads:
-                R_load, pos_load = rlt.create_rotation_matrix(
-                    np.radians(load['euler_angles']),
-                    # np.array(load['euler_angles']),
-                    load['rotation_order'],
-                    load['translation']
-                )
-                
-                # Calculate gravity force if mass is present
-                gravity_force = np.zeros(3)
-                gravity_moment = np.zeros(3)
-
-                if 'mass' in load and load['mass'] > 0:
-                    # Get center of gravity or use load position if not specified
-                    cogL = np.array(load.get('cog', [0, 0, 0]))
-                    if np.all(cogL == 0):  # If COG is not specified, use load position
-                        cogg = load['translation']
-                    else:
-                        # COG is specified relative to load coordinate system, transform to global
-                        cogg = load['translation'] + R_load @ cogL
-                        
-                    # Calculate gravity force in global coordinates
-                    gravity_force_global = load['mass'] * gravity_value * gravity_dir
-                    # Transform gravity force from global to load coordinate system
-                    R_loadg, pos_loadg = rlt.create_rotation_matrix(np.radians(load['euler_angles']),load['rotation_order'],cogg)
-                    gravity_force = R_loadg.T @ gravity_force_global
-                    gravity_moment = np.cross(cogL, gravity_force_global)
-                # Add gravity force to load force
-                load_force = np.array(load.get('force', [0, 0, 0])) + gravity_force
-                load_moment = np.array(load.get('moment', [0, 0, 0])) + gravity_moment
-
-                F, M = rlt.rigid_load_transfer(
-                    load_force,
-                    load_moment,
-                    R_load, pos_load,
-                    R_target, pos_target
-                )
-                total_F += F
-                total_M += M
+            # Results for this target
+            total_F, total_M = target_F[i], target_M[i]
 
             results.append({
                 # 'System': f'Target {i+1}',
                 'System': target.get('name', f'Target {i+1}'),
-                'Fx': f"{total_F[0]:.2f}", 'Fy': f"{total_F[1]:.2f}", 'Fz': f"{total_F[2]:.2f}",
-                'Mx': f"{total_M[0]:.2f}", 'My': f"{total_M[1]:.2f}", 'Mz': f"{total_M[2]:.2f}"
+                # Kept numeric, the table formats them
+                'Fx': float(total_F[0]), 'Fy': float(total_F[1]), 'Fz': float(total_F[2]),
+                'Mx': float(total_M[0]), 'My': float(total_M[1]), 'Mz': float(total_M[2])
             })
 
         except Exception as e:
             print(f"Error processing target {i}: {e}")
 
+    # Build the figure in one go, validating each trace once
+    fig = go.Figure(data=traces)
+
     # Configure plot
     # Update layout with theme
     fig.update_layout(
@@ -813,6 +792,26 @@ def update_visualization(loads,
         scene_aspectmode='data',
         font=dict(color=theme_colors['text_color'])
     )
+
+    return fig.to_dict(), results
+
+# Visualization callback
+@app.callback(
+    [Output('3d-plot', 'figure'),
+     Output('results-container', 'children')],
+    [Input('loads-store', 'data'),
+     Input('targets-store', 'data'),
+     Input('gravity-store', 'data'),
+     Input('theme-selector', 'value')]
+)
+def update_visualization(loads, 
+                         targets,
+                         gravity,
+                         theme):
+    fig, results = _build_figure(json_dumps_sorted(loads),
+                                 json_dumps_sorted(targets),
+                                 json_dumps_sorted(gravity),
+                                 theme)
     dark_templates = ['dark','night']
     is_dark = theme in dark_templates 
     # # ----------------------------------------------------------
@@ -836,7 +835,9 @@ def update_visualization(loads,
     # is_dark = template in dark_templates
     # # ----------------------------------------------------------
     table = dash_table.DataTable(
-        columns=[{'name': col, 'id': col} for col in ['System', 'Fx', 'Fy', 'Fz', 'Mx', 'My', 'Mz']],
+        columns=[{'name': 'System', 'id': 'System'}] +
+                [{'name': col, 'id': col, 'type': 'numeric', 'format': Format(precision=2, scheme=Scheme.fixed)}
+                 for col in ['Fx', 'Fy', 'Fz', 'Mx', 'My', 'Mz']],
         data=results,
         style_cell={
             'textAlign': 'center',
@@ -864,10 +865,11 @@ def update_visualization(loads,
      State('targets-store', 'data'),
      State('gravity-store', 'data'),
      State('export-format', 'value'),
-     State('results-container', 'children')],
+     State('results-container', 'children'),
+     State('from-graph-store', 'data')],
     prevent_initial_call=True
 )
-def export_data(n_clicks, loads, targets, gravity, export_format, results):
+def export_data(n_clicks, loads, targets, gravity, export_format, results, from_graph):
     if n_clicks is None:
         return dash.no_update
     
@@ -878,14 +880,9 @@ def export_data(n_clicks, loads, targets, gravity, export_format, results):
     # Determine if we should use classic format based on user selection or auto-detection
     use_classic_format = export_format == 'classic'
     
-    # If auto detection, check if targets came from edges
+    # If auto detection, use the new format when the targets came from edges
     if export_format == 'auto':
-        use_classic_format = True
-        # If any target has an 'edge_id' or comes from an edge, use new format
-        for target in targets:
-            if any(key in target for key in ['edge_id', 'source', 'target']):
-                use_classic_format = False
-                break
+        use_classic_format = not from_graph
     
     if use_classic_format:
         # Export in classic RLT format (loads and targets)
@@ -901,24 +898,15 @@ def export_data(n_clicks, loads, targets, gravity, export_format, results):
                 if i < len(results['props']['data']):
                     result_row = results['props']['data'][i]
                     target["rlt_results"] = {
-                        "force": [
-                            float(result_row.get('Fx', '0').replace(',', '')),
-                            float(result_row.get('Fy', '0').replace(',', '')),
-                            float(result_row.get('Fz', '0').replace(',', ''))
-                        ],
-                        "moment": [
-                            float(result_row.get('Mx', '0').replace(',', '')),
-                            float(result_row.get('My', '0').replace(',', '')),
-                            float(result_row.get('Mz', '0').replace(',', ''))
-                        ],
+                        "force": [result_row.get(key, 0.0) for key in ('Fx', 'Fy', 'Fz')],
+                        "moment": [result_row.get(key, 0.0) for key in ('Mx', 'My', 'Mz')],
                         "is_valid": True,
                         "timestamp": datetime.now().isoformat()
                     }
         
         # Export as JSON file in classic format
         json_filename = f"RLT_Data_{timestamp}.json"
-        json_str = json.dumps(classic_data, indent=2)
-        formatted_json = format_json_compact_arrays(json_str)
+        formatted_json = dump_json_compact_arrays(classic_data)
         return dict(content=formatted_json, filename=json_filename)
     else:
         # Create JSON structure matching the new format with nodes and edges
@@ -983,23 +971,14 @@ def export_data(n_clicks, loads, targets, gravity, export_format, results):
             # If we have results, update the edge with calculated values
             if results and 'props' in results and 'data' in results['props'] and i < len(results['props']['data']):
                 result_row = results['props']['data'][i]
-                edge["interface_properties"]["rlt_results"]["force"] = [
-                    float(result_row.get('Fx', '0').replace(',', '')),
-                    float(result_row.get('Fy', '0').replace(',', '')),
-                    float(result_row.get('Fz', '0').replace(',', ''))
-                ]
-                edge["interface_properties"]["rlt_results"]["moment"] = [
-                    float(result_row.get('Mx', '0').replace(',', '')),
-                    float(result_row.get('My', '0').replace(',', '')),
-                    float(result_row.get('Mz', '0').replace(',', ''))
-                ]
+                edge["interface_properties"]["rlt_results"]["force"] = [result_row.get(key, 0.0) for key in ('Fx', 'Fy', 'Fz')]
+                edge["interface_properties"]["rlt_results"]["moment"] = [result_row.get(key, 0.0) for key in ('Mx', 'My', 'Mz')]
             
             json_data["edges"].append(edge)
         
         # Export as JSON file
         json_filename = f"RLT_Data_{timestamp}.json"
-        json_str = json.dumps(json_data, indent=2)
-        formatted_json = format_json_compact_arrays(json_str)
+        formatted_json = dump_json_compact_arrays(json_data)
         return dict(content=formatted_json, filename=json_filename)
 
 @app.callback(
@@ -1017,7 +996,6 @@ def export_plot_html(n_clicks, figure):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
     # Create an interactive HTML representation of the figure
-    import plotly.io as pio
     html_content = pio.to_html(
         figure, 
         include_plotlyjs=True,
@@ -1034,21 +1012,23 @@ def export_plot_html(n_clicks, figure):
 @app.callback(
     [Output('loads-store', 'data', allow_duplicate=True),
      Output('targets-store', 'data', allow_duplicate=True),
-     Output('gravity-store', 'data', allow_duplicate=True)],
+     Output('gravity-store', 'data', allow_duplicate=True),
+     Output('input-counts', 'data', allow_duplicate=True),
+     Output('from-graph-store', 'data')],
     [Input('upload-data', 'contents')],
     [State('upload-data', 'filename')],
     prevent_initial_call=True
 )
 def update_stores_from_file(contents, filename):
     if contents is None:
-        return dash.no_update, dash.no_update, dash.no_update
+        return dash.no_update, dash.no_update, dash.no_update, dash.no_update, dash.no_update
 
     content_type, content_string = contents.split(',')
     decoded = base64.b64decode(content_string)
     
     try:
         if filename.endswith('.json'):
-            data = json.loads(decoded.decode('utf-8'))
+            data = json_loads(decoded)
             
             # Handle new JSON format with nodes and edges
             if 'nodes' in data and 'edges' in data:
@@ -1056,6 +1036,10 @@ def update_stores_from_file(contents, filename):
                 targets = []
                 gravity_data = data.get('gravity', {'value': 9.81, 'direction': [0, 0, -1]})
                 
+                # Fallback colors for all nodes and edges, drawn in one call
+                n_nodes = len(data['nodes'])
+                random_colors = np.random.randint(0, 0xFFFFFF, size=n_nodes + len(data['edges'])).tolist()
+                
                 # Process nodes as loads
                 node_id_map = {}  # To track node IDs and their index in the loads array
                 for i, node in enumerate(data['nodes']):
@@ -1079,7 +1063,7 @@ def update_stores_from_file(contents, filename):
                         'euler_angles': node_data.get('euler_angles', [0.0, 0.0, 0.0]),
                         'rotation_order': node_data.get('rotation_order', 'xyz'),
                         'translation': node_data.get('translation', [0.0, 0.0, 0.0]),
-                        'color': {'hex': node_data.get('color', f'#{np.random.randint(0, 0xFFFFFF):06x}')},
+                        'color': {'hex': node_data.get('color', f'#{random_colors[i]:06x}')},
                         'mass': node_data.get('mass', 0.0),
                         'cog': node_data.get('cog', [0.0, 0.0, 0.0])
                     }
@@ -1107,31 +1091,32 @@ def update_stores_from_file(contents, filename):
                         'euler_angles': interface_props.get('euler_angles', [0.0, 0.0, 0.0]),
                         'rotation_order': interface_props.get('rotation_order', 'xyz'),
                         'translation': interface_props.get('position', [0.0, 0.0, 0.0]),
-                        'color': {'hex': f'#{np.random.randint(0, 0xFFFFFF):06x}'}
+                        'color': {'hex': f'#{random_colors[n_nodes + i]:06x}'}
                     }
                     targets.append(target)
                 
-                return loads, targets, gravity_data
+                # Clear the rendered counts so the input controls are rebuilt
+                return loads, targets, gravity_data, None, True
             
             # Handle old format with loads and targets directly
             else:
                 # No need to add edge info since this is classic format
-                # Convert angles from degrees to radians (no conversion needed for new format)
+                # Angles are stored in degrees in both formats, only make sure they are lists
                 for load in data.get('loads', []):
                     if 'euler_angles' in load:
-                        load['euler_angles'] = np.array(load['euler_angles']).tolist()
+                        load['euler_angles'] = list(load['euler_angles'])
                 
                 for target in data.get('targets', []):
                     if 'euler_angles' in target:
-                        target['euler_angles'] = np.array(target['euler_angles']).tolist()
+                        target['euler_angles'] = list(target['euler_angles'])
                 
-                return data.get('loads', []), data.get('targets', []), data.get('gravity', {'value': 9.81, 'direction': [0, 0, -1]})
+                return data.get('loads', []), data.get('targets', []), data.get('gravity', {'value': 9.81, 'direction': [0, 0, -1]}), None, False
             
         else:
             raise ValueError("Unsupported file format")
     except Exception as e:
         print(f"Error parsing file: {e}")
-        return dash.no_update, dash.no_update, dash.no_update
+        return dash.no_update, dash.no_update, dash.no_update, dash.no_update, dash.no_update
 
 # Helper functions to handle both old and new JSON formats
 def get_node_data(node):
@@ -1,24 +1,164 @@
+import os
 import sys
 import json
+import tempfile
+from functools import partial
 import numpy as np
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                                QPushButton, QLabel, QLineEdit, QScrollArea, QFileDialog,
                                QTableWidget, QTableWidgetItem, QSplitter, QComboBox)
-from PySide6.QtWebEngineWidgets import QWebEngineView
-from PySide6.QtCore import Qt, Signal, QObject
-import plotly.graph_objects as go
+from PySide6.QtCore import (Qt, Signal, QObject, QTimer, QLocale, QRunnable, QThreadPool, QUrl,
+                            QSignalBlocker, QStandardPaths)
+from PySide6.QtGui import QDoubleValidator
 import rigid_load_transfer as rlt
-import plot_3d as plot3d
+
+# plotly, plot_3d and Qt WebEngine take seconds to import, so they are only
+# imported once needed: by the first plot build and after the window is shown
+
+# Page loaded once into the web view; figures are then drawn into #gd with Plotly.react.
+# plotly.js is the copy bundled with the plotly package, see plotly_js_file
+PLOT_PAGE_HTML = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<script src="{plotly_js}"></script>
+<style>html, body, #gd {{ margin: 0; width: 100%; height: 100%; overflow: hidden; }}</style>
+</head>
+<body><div id="gd"></div></body>
+</html>
+"""
+
+# Arrows are drawn as one shaft trace and one tip trace per category:
+# category -> (legend name, tip color, tip size)
+ARROW_STYLES = {
+    'load_csys': ('Load CSYS', '#3498db', 0.5),
+    'force': ('Forces', '#e74c3c', 0.3),
+    'moment': ('Moments', '#2ecc71', 0.3),
+    'target_csys': ('Target CSYS', '#f1c40f', 0.5),
+}
+TRIAD_COLORS = ['red', 'green', 'blue']
+VECTOR_COLOR = 'darkblue'
+DEG2RAD = np.float64(np.pi / 180.0)
+
+# Arrows skip hover; each system's origin gets one marker carrying its hover
+# text instead, one trace per kind: category -> marker color
+ORIGIN_STYLES = {
+    'load_origins': '#3498db',
+    'target_origins': '#f1c40f',
+}
+
+# Trace categories to redraw for each kind of edit. Names only appear in the
+# origins' hover text; a 'geom' edit (position, rotation, added system)
+# redraws everything
+REDRAW_CATEGORIES = {
+    'name': set(ORIGIN_STYLES),
+    'loads': {'force', 'moment', 'load_origins'},
+}
+
+def plotly_js_file():
+    """
+    Path of the plotly.js bundled with the plotly package, written to the
+    user's cache directory once per plotly version so the plot page never
+    needs the network
+    """
+    from plotly.offline import get_plotlyjs, get_plotlyjs_version
+    # Per user, so no other account can plant script the page would load
+    directory = os.path.join(QStandardPaths.writableLocation(QStandardPaths.CacheLocation), 'plotly')
+    path = os.path.join(directory, f"plotly-{get_plotlyjs_version()}.min.js")
+    plotly_js = get_plotlyjs().encode('utf-8')
+    # An existing copy is only trusted if it is exactly the bundled file
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == plotly_js:
+                return path
+    except OSError:
+        pass
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    # Written under a fresh temporary name so another instance never reads half a file
+    fd, partial_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(plotly_js)
+    os.replace(partial_path, path)
+    return path
 
 class SystemEmitter(QObject):
     data_changed = Signal()
 
+    def __init__(self, parent=None, interval=150):
+        super().__init__(parent)
+        # Edits restart this timer, so a burst of keystrokes emits data_changed once
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self.data_changed)
+        # Kinds of edits ('name', 'loads', 'geom') since the last take_dirty
+        self._dirty = set()
+
+    def schedule_change(self, kind='geom'):
+        self._dirty.add(kind)
+        self._timer.start()
+
+    def take_dirty(self):
+        """Kinds of edits made since the last call"""
+        dirty, self._dirty = self._dirty, set()
+        return dirty
+
+    def flush(self):
+        """Emit a pending change right away"""
+        if self._timer.isActive():
+            self._timer.stop()
+            self.data_changed.emit()
+
+class SystemArrays:
+    """
+    Inputs of all load or target systems, one row per system: names as a list,
+    rotation orders as an int8 array of rlt.ORDER_CODES and numeric fields as
+    (N, 3) arrays, the arrays with spare rows for adding more
+    """
+    def __init__(self, fields, capacity=8):
+        self.count = 0
+        self.names = []
+        self.order_codes = np.zeros(capacity, dtype=np.int8)
+        self._arrays = {field: np.zeros((capacity, 3)) for field in fields}
+    
+    def __len__(self):
+        return self.count
+    
+    def append(self, data):
+        """Add a system from a dict of its inputs and return its row index"""
+        index = self.count
+        if index == len(self.order_codes):
+            self.order_codes = np.concatenate([self.order_codes, np.zeros_like(self.order_codes)])
+            for field, array in self._arrays.items():
+                self._arrays[field] = np.concatenate([array, np.zeros_like(array)])
+        for field, array in self._arrays.items():
+            array[index] = data[field]
+        self.names.append(data['name'])
+        self.order_codes[index] = rlt.ORDER_CODES[data['rotation_order']]
+        self.count += 1
+        return index
+    
+    def set_value(self, field, index, component, value):
+        self._arrays[field][index, component] = value
+    
+    def snapshot(self):
+        """Copy of the current inputs, dict of the names list and the arrays"""
+        data = {field: array[:self.count].copy() for field, array in self._arrays.items()}
+        data['name'] = list(self.names)
+        data['order_code'] = self.order_codes[:self.count].copy()
+        return data
+
+LOAD_FIELDS = ('translation', 'euler_angles', 'force', 'moment')
+TARGET_FIELDS = ('translation', 'euler_angles')
+
 class SystemInputWidget(QWidget):
-    def __init__(self, system_type, index, initial_data, emitter, parent=None):
+    def __init__(self, system_type, index, initial_data, emitter, store, parent=None):
         super().__init__(parent)
         self.system_type = system_type
         self.index = index
         self.emitter = emitter
+        # Edited values are written straight into this row of the store
+        self.store = store
         self.init_ui(initial_data)
         
     def init_ui(self, data):
@@ -32,64 +172,77 @@ class SystemInputWidget(QWidget):
             }
         """)
         
+        # Numeric fields only accept numbers (with '.' as decimal point); their
+        # parsed values are written to the store on every edit
+        self.number_validator = QDoubleValidator(self)
+        self.number_validator.setLocale(QLocale.c())
+        
         # Name input
         name_layout = QHBoxLayout()
         name_layout.addWidget(QLabel("Name:"))
-        self.name_input = QLineEdit(data.get('name', f'{self.system_type} System {self.index+1}'))
-        self.name_input.textChanged.connect(self.emit_changes)
+        self.name_input = QLineEdit()
+        self.name_input.textChanged.connect(self.set_name)
         name_layout.addWidget(self.name_input)
         
         # Position inputs
         pos_layout = QHBoxLayout()
         pos_layout.addWidget(QLabel("Position (X,Y,Z):"))
-        self.tx = QLineEdit(str(data['translation'][0]))
-        self.ty = QLineEdit(str(data['translation'][1]))
-        self.tz = QLineEdit(str(data['translation'][2]))
-        for inp in [self.tx, self.ty, self.tz]:
+        self.tx = QLineEdit()
+        self.ty = QLineEdit()
+        self.tz = QLineEdit()
+        for index, inp in enumerate([self.tx, self.ty, self.tz]):
             inp.setFixedWidth(60)
-            inp.textChanged.connect(self.emit_changes)
+            inp.setValidator(self.number_validator)
+            inp.textChanged.connect(partial(self.set_component, 'translation', index))
+            inp.editingFinished.connect(self.emitter.flush)
             pos_layout.addWidget(inp)
         
         # Rotation order
         rot_order_layout = QHBoxLayout()
         rot_order_layout.addWidget(QLabel("Rotation Order:"))
         self.rot_order = QComboBox()
-        self.rot_order.addItems(['xyz', 'xzy', 'yxz', 'yzx', 'zxy', 'zyx'])
-        self.rot_order.setCurrentText(data['rotation_order'])
-        self.rot_order.currentTextChanged.connect(self.emit_changes)
+        # Item indices are the orders' codes
+        self.rot_order.addItems(rlt.ROTATION_ORDERS)
+        self.rot_order.currentIndexChanged.connect(self.set_rotation_order)
         rot_order_layout.addWidget(self.rot_order)
         
         # Rotation inputs
         rot_layout = QHBoxLayout()
         rot_layout.addWidget(QLabel("Rotation (deg):"))
-        self.rx = QLineEdit(str(data['euler_angles'][0]))
-        self.ry = QLineEdit(str(data['euler_angles'][1]))
-        self.rz = QLineEdit(str(data['euler_angles'][2]))
-        for inp in [self.rx, self.ry, self.rz]:
+        self.rx = QLineEdit()
+        self.ry = QLineEdit()
+        self.rz = QLineEdit()
+        for index, inp in enumerate([self.rx, self.ry, self.rz]):
             inp.setFixedWidth(60)
-            inp.textChanged.connect(self.emit_changes)
+            inp.setValidator(self.number_validator)
+            inp.textChanged.connect(partial(self.set_component, 'euler_angles', index))
+            inp.editingFinished.connect(self.emitter.flush)
             rot_layout.addWidget(inp)
         
         # Force inputs (only for load systems)
         if self.system_type == 'load':
             force_layout = QHBoxLayout()
             force_layout.addWidget(QLabel("Force (X,Y,Z):"))
-            self.fx = QLineEdit(str(data['force'][0]))
-            self.fy = QLineEdit(str(data['force'][1]))
-            self.fz = QLineEdit(str(data['force'][2]))
-            for inp in [self.fx, self.fy, self.fz]:
+            self.fx = QLineEdit()
+            self.fy = QLineEdit()
+            self.fz = QLineEdit()
+            for index, inp in enumerate([self.fx, self.fy, self.fz]):
                 inp.setFixedWidth(60)
-                inp.textChanged.connect(self.emit_changes)
+                inp.setValidator(self.number_validator)
+                inp.textChanged.connect(partial(self.set_component, 'force', index))
+                inp.editingFinished.connect(self.emitter.flush)
                 force_layout.addWidget(inp)
             
             moment_layout = QHBoxLayout()
             moment_layout.addWidget(QLabel("Moment (X,Y,Z):"))
-            self.mx = QLineEdit(str(data['moment'][0]))
-            self.my = QLineEdit(str(data['moment'][1]))
-            self.mz = QLineEdit(str(data['moment'][2]))
-            for inp in [self.mx, self.my, self.mz]:
+            self.mx = QLineEdit()
+            self.my = QLineEdit()
+            self.mz = QLineEdit()
+            for index, inp in enumerate([self.mx, self.my, self.mz]):
                 inp.setFixedWidth(60)
-                inp.textChanged.connect(self.emit_changes)
+                inp.setValidator(self.number_validator)
+                inp.textChanged.connect(partial(self.set_component, 'moment', index))
+                inp.editingFinished.connect(self.emitter.flush)
                 moment_layout.addWidget(inp)
         
         # Assemble layout
@@ -102,16 +255,266 @@ class SystemInputWidget(QWidget):
             layout.addLayout(moment_layout)
         
         self.setLayout(layout)
+        
+        # Numeric inputs per store field, filled in by set_data
+        self.field_inputs = {
+            'translation': (self.tx, self.ty, self.tz),
+            'euler_angles': (self.rx, self.ry, self.rz),
+        }
+        if self.system_type == 'load':
+            self.field_inputs['force'] = (self.fx, self.fy, self.fz)
+            self.field_inputs['moment'] = (self.mx, self.my, self.mz)
+        self.set_data(data)
+    
+    def set_data(self, data):
+        """
+        Show and store all inputs of a system with the widgets' signals blocked,
+        so filling in the fields schedules no redraws; the caller asks for one
+        """
+        name = data.get('name', f'{self.system_type} System {self.index+1}')
+        with QSignalBlocker(self.name_input), QSignalBlocker(self.rot_order):
+            self.name_input.setText(name)
+            self.rot_order.setCurrentIndex(rlt.ORDER_CODES[data['rotation_order']])
+        self.store.names[self.index] = name
+        self.store.order_codes[self.index] = self.rot_order.currentIndex()
+        
+        for field, inputs in self.field_inputs.items():
+            for component, inp in enumerate(inputs):
+                value = data[field][component]
+                with QSignalBlocker(inp):
+                    inp.setText(str(value))
+                self.store.set_value(field, self.index, component, float(value))
+    
+    def set_name(self, text):
+        self.store.names[self.index] = text
+        self.emit_changes('name')
+    
+    def set_rotation_order(self, code):
+        self.store.order_codes[self.index] = code
+        self.emit_changes()
+    
+    def set_component(self, field, component, text):
+        try:
+            value = float(text or 0)
+        except ValueError:
+            # Partial input such as '-' or '1e' keeps the last value
+            return
+        self.store.set_value(field, self.index, component, value)
+        self.emit_changes('loads' if field in ('force', 'moment') else 'geom')
+    
+    def emit_changes(self, kind='geom', *args):
+        self.emitter.schedule_change(kind)
+
+class PlotFigure:
+    """
+    The plot's go.Figure, built on first use and then updated in place: the Global
+    marker, a shafts and a tips trace per arrow category (in ARROW_STYLES order),
+    an origin marker trace per ORIGIN_STYLES category and the layout. Not thread
+    safe, only the plot pool's one thread uses it.
+    """
+    def __init__(self):
+        self.figure = None
+    
+    def build(self):
+        import plotly.graph_objects as go
+        import plot_3d as plot3d
+        
+        fig = go.Figure()
+        
+        # Add global system
+        fig.add_trace(go.Scatter3d(x=[0], y=[0], z=[0], mode='markers',
+                                  marker=dict(size=4, color='black'), name='Global'))
+        
+        # Hover is only built for the origins, arrows are left out of picking
+        for name, tip_color, tip_size in ARROW_STYLES.values():
+            arrows = plot3d.create_arrows([], [], [], tip_color, tip_size, name=name)
+            for trace in arrows:
+                trace.hoverinfo = 'skip'
+            fig.add_traces(arrows)
+        
+        for color in ORIGIN_STYLES.values():
+            fig.add_trace(go.Scatter3d(x=[], y=[], z=[], mode='markers',
+                                      marker=dict(size=3, color=color),
+                                      hoverinfo='text', showlegend=False))
+        
+        # Update plot layout
+        fig.update_layout(
+            scene=dict(
+                xaxis=dict(title='X'),
+                yaxis=dict(title='Y'),
+                zaxis=dict(title='Z'),
+                aspectmode='cube',
+                camera=dict(up=dict(x=0, y=0, z=1))
+            ),
+            margin=dict(l=0, r=0, b=0, t=30),
+            showlegend=True,
+            scene_aspectmode='data',
+            uirevision='rlt'  # keep the user's camera between updates
+        )
+        self.figure = fig
+    
+    def trace_indices(self, category):
+        if category in ORIGIN_STYLES:
+            return [1 + 2 * len(ARROW_STYLES) + list(ORIGIN_STYLES).index(category)]
+        position = list(ARROW_STYLES).index(category)
+        return [1 + 2 * position, 2 + 2 * position]
+    
+    def set_arrows(self, category, starts, ends, colors):
+        import plot_3d as plot3d
+        if self.figure is None:
+            self.build()
+        shafts, tips = (self.figure.data[index] for index in self.trace_indices(category))
+        plot3d.update_arrows(shafts, tips, starts, ends, colors)
+    
+    def set_origins(self, category, points, text):
+        if self.figure is None:
+            self.build()
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        origins = self.figure.data[self.trace_indices(category)[0]]
+        origins.update(x=points[:, 0], y=points[:, 1], z=points[:, 2], hovertext=text)
+    
+    def to_json(self):
+        return self.figure.to_json()
     
-    def emit_changes(self):
-        self.emitter.data_changed.emit()
+    def traces_json(self, trace_indices):
+        """Given traces only, as the JSON of a figure holding just those"""
+        from plotly.utils import PlotlyJSONEncoder
+        traces = [self.figure.data[index].to_plotly_json() for index in trace_indices]
+        return json.dumps({'data': traces}, cls=PlotlyJSONEncoder)
+
+def build_plot(plot_figure, loads, targets, categories=None):
+    """
+    Update plot_figure and get the results for the given systems (SystemArrays
+    snapshots), without touching any widget so it can run on a worker thread.
+    Returns the figure as JSON, one row of results table texts per target (None
+    where the target failed) and the trace indices.
+
+    With categories=None the whole figure is returned and the indices are None.
+    Otherwise only the traces of those arrow categories are updated and returned,
+    with the indices where they sit in the full figure, for an in-place update.
+    """
+    import plot_3d as plot3d
+    
+    # Angles are entered in degrees, converted for all systems at once
+    load_euler_rad = loads['euler_angles'] * DEG2RAD
+    target_euler_rad = targets['euler_angles'] * DEG2RAD
+    
+    # Frames of all systems as (N, 3, 3) stacks built from their int-coded
+    # rotation orders; the load frames are reused for every target
+    R_loads = rlt.create_rotation_matrices_from_codes(load_euler_rad, loads['order_code'])
+    R_targets = rlt.create_rotation_matrices_from_codes(target_euler_rad, targets['order_code'])
+    
+    # Loads in global coordinates, (N, 3) stacks
+    F_world = (R_loads @ loads['force'][..., None])[..., 0]
+    M_world = (R_loads @ loads['moment'][..., None])[..., 0]
+    
+    # Arrow segments gathered per category: starts, ends, shaft colors
+    arrows = {category: ([], [], []) for category in ARROW_STYLES}
+    def add_arrows(category, starts, ends, colors):
+        for column, values in zip(arrows[category], (starts, ends, colors)):
+            column.extend(values)
+    
+    # Hover text of each system's origin marker
+    origin_text = {'load_origins': [], 'target_origins': []}
+    
+    # Process loads
+    for i, name in enumerate(loads['name']):
+        try:
+            R, pos = R_loads[i], loads['translation'][i]
+            
+            # Add coordinate system
+            starts, ends = plot3d.triad_segments(R, pos)
+            add_arrows('load_csys', starts, ends, TRIAD_COLORS)
+            
+            # Add vectors
+            add_arrows('force', [pos], [plot3d.vector_end_point(pos, F_world[i])], [VECTOR_COLOR])
+            add_arrows('moment', [pos], [plot3d.vector_end_point(pos, M_world[i])], [VECTOR_COLOR])
+            
+        except Exception as e:
+            print(f"Error processing load {i}: {e}")
+        origin_text['load_origins'].append(
+            f"{name}<br>Force: {loads['force'][i].tolist()}<br>Moment: {loads['moment'][i].tolist()}"
+        )
+    
+    # Sum all loads once. Any target only needs F, M and the sum of r x F
+    # to get its totals
+    sum_F = F_world.sum(axis=0)
+    sum_M = M_world.sum(axis=0)
+    sum_rxF = np.cross(loads['translation'], F_world).sum(axis=0)
+    
+    # Process targets and calculate results, one table row per target
+    result_rows = [None] * len(targets['name'])
+    for i, name in enumerate(targets['name']):
+        try:
+            R_target, pos_target = R_targets[i], targets['translation'][i]
+            
+            # Add coordinate system
+            starts, ends = plot3d.triad_segments(R_target, pos_target)
+            add_arrows('target_csys', starts, ends, TRIAD_COLORS)
+            
+            # Calculate results, moving the summed moment to the target origin
+            total_F = R_target.T @ sum_F
+            total_M = R_target.T @ (sum_M + sum_rxF - rlt.cross3(pos_target, sum_F))
+            
+            result_rows[i] = [name] + [f"{val:.2f}" for val in (*total_F, *total_M)]
+            
+        except Exception as e:
+            print(f"Error processing target {i}: {e}")
+        origin_text['target_origins'].append(name)
+    
+    for category, (starts, ends, colors) in arrows.items():
+        if categories is None or category in categories:
+            plot_figure.set_arrows(category, starts, ends, colors)
+    
+    origin_points = {'load_origins': loads['translation'], 'target_origins': targets['translation']}
+    for category, text in origin_text.items():
+        if categories is None or category in categories:
+            plot_figure.set_origins(category, origin_points[category], text)
+    
+    if categories is None:
+        return plot_figure.to_json(), result_rows, None
+    
+    trace_indices = [index for category in (*ARROW_STYLES, *ORIGIN_STYLES) if category in categories
+                     for index in plot_figure.trace_indices(category)]
+    return plot_figure.traces_json(trace_indices), result_rows, trace_indices
+
+class PlotWorkerSignals(QObject):
+    # generation, figure JSON, result rows, trace indices (None for a whole figure)
+    finished = Signal(int, str, object, object)
+
+class PlotWorker(QRunnable):
+    """Runs build_plot off the GUI thread and reports back through its signals"""
+    def __init__(self, generation, plot_figure, loads, targets, categories=None):
+        super().__init__()
+        self.generation = generation
+        self.plot_figure = plot_figure
+        self.loads = loads
+        self.targets = targets
+        self.categories = categories
+        self.signals = PlotWorkerSignals()
+    
+    def run(self):
+        try:
+            result = build_plot(self.plot_figure, self.loads, self.targets, self.categories)
+        except Exception as e:
+            print(f"Error building plot: {e}")
+            return
+        self.signals.finished.emit(self.generation, *result)
 
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
-        self.loads = []
-        self.targets = []
+        self.loads = SystemArrays(LOAD_FIELDS)
+        self.targets = SystemArrays(TARGET_FIELDS)
         self.emitter = SystemEmitter()
+        self._plot_generation = 0
+        # One thread, so builds run in order and may share the figure they update
+        self.plot_pool = QThreadPool(self)
+        self.plot_pool.setMaxThreadCount(1)
+        self.plot_figure = PlotFigure()
+        # What still has to be redrawn: the whole figure, or these arrow categories
+        self._redraw_all = True
+        self._redraw_categories = set()
         self.emitter.data_changed.connect(self.update_plot)
         self.init_ui()
         
@@ -164,17 +567,26 @@ class MainWindow(QMainWindow):
         right_widget = QWidget()
         right_layout = QVBoxLayout()
         
-        # Plot view
-        self.web_view = QWebEngineView()
+        # Plot view, created by init_plot_view once the window is up; figures
+        # built before its page has loaded are kept until then
+        self.web_view = None
+        self._plot_page_ready = False
+        self._pending_figure_json = None
+        self.plot_placeholder = QLabel("Loading plot...")
+        self.plot_placeholder.setAlignment(Qt.AlignCenter)
         self.results_table = QTableWidget()
         self.results_table.setColumnCount(7)
         self.results_table.setHorizontalHeaderLabels(
             ["System", "Fx", "Fy", "Fz", "Mx", "My", "Mz"]
         )
+        # Items of each table row, kept so updates only change their text
+        self._result_items = []
         
-        right_layout.addWidget(self.web_view, 3)
+        right_layout.addWidget(self.plot_placeholder, 3)
         right_layout.addWidget(self.results_table, 1)
         right_widget.setLayout(right_layout)
+        self.right_layout = right_layout
+        QTimer.singleShot(0, self.init_plot_view)
         
         main_splitter.addWidget(left_widget)
         main_splitter.addWidget(right_widget)
@@ -195,9 +607,10 @@ class MainWindow(QMainWindow):
             'rotation_order': 'xyz',
             'translation': [0.0, 0.0, 0.0]
         }
-        self.loads.append(new_load)
-        widget = SystemInputWidget('load', len(self.loads)-1, new_load, self.emitter)
+        index = self.loads.append(new_load)
+        widget = SystemInputWidget('load', index, new_load, self.emitter, self.loads)
         self.loads_layout.addWidget(widget)
+        self.emitter.schedule_change()
         
     def add_target_system(self):
         new_target = {
@@ -206,176 +619,119 @@ class MainWindow(QMainWindow):
             'rotation_order': 'xyz',
             'translation': [0.0, 0.0, 0.0]
         }
-        self.targets.append(new_target)
-        widget = SystemInputWidget('target', len(self.targets)-1, new_target, self.emitter)
+        index = self.targets.append(new_target)
+        widget = SystemInputWidget('target', index, new_target, self.emitter, self.targets)
         self.targets_layout.addWidget(widget)
+        self.emitter.schedule_change()
     
     def get_current_data(self):
-        # Update loads data
-        for i in range(self.loads_layout.count()):
-            widget = self.loads_layout.itemAt(i).widget()
-            if isinstance(widget, SystemInputWidget):
-                self.loads[i] = {
-                    'name': widget.name_input.text(),
-                    'translation': [
-                        float(widget.tx.text() or 0),
-                        float(widget.ty.text() or 0),
-                        float(widget.tz.text() or 0)
-                    ],
-                    'rotation_order': widget.rot_order.currentText(),
-                    'euler_angles': [
-                        float(widget.rx.text() or 0),
-                        float(widget.ry.text() or 0),
-                        float(widget.rz.text() or 0)
-                    ],
-                    'force': [
-                        float(widget.fx.text() or 0),
-                        float(widget.fy.text() or 0),
-                        float(widget.fz.text() or 0)
-                    ],
-                    'moment': [
-                        float(widget.mx.text() or 0),
-                        float(widget.my.text() or 0),
-                        float(widget.mz.text() or 0)
-                    ]
-                }
-        
-        # Update targets data
-        for i in range(self.targets_layout.count()):
-            widget = self.targets_layout.itemAt(i).widget()
-            if isinstance(widget, SystemInputWidget):
-                self.targets[i] = {
-                    'name': widget.name_input.text(),
-                    'translation': [
-                        float(widget.tx.text() or 0),
-                        float(widget.ty.text() or 0),
-                        float(widget.tz.text() or 0)
-                    ],
-                    'rotation_order': widget.rot_order.currentText(),
-                    'euler_angles': [
-                        float(widget.rx.text() or 0),
-                        float(widget.ry.text() or 0),
-                        float(widget.rz.text() or 0)
-                    ]
-                }
-        
-        return self.loads, self.targets
+        # Widgets write their edits into the stores; copied so the plot worker
+        # never sees later edits
+        return self.loads.snapshot(), self.targets.snapshot()
     
     def update_plot(self):
+        # Build on the thread pool; only the newest request is shown when done
         loads, targets = self.get_current_data()
-        fig = go.Figure()
-        results = []
         
-        # Add global system
-        fig.add_trace(go.Scatter3d(x=[0], y=[0], z=[0], mode='markers',
-                                  marker=dict(size=4, color='black'), name='Global'))
+        # Edits pile up until a build is shown, so a newer build that replaces
+        # an unfinished one also redraws what that one would have
+        dirty = self.emitter.take_dirty()
+        if not dirty or 'geom' in dirty:
+            self._redraw_all = True
+        for kind in dirty:
+            self._redraw_categories |= REDRAW_CATEGORIES.get(kind, set())
+        categories = None if self._redraw_all else set(self._redraw_categories)
         
-        # Process loads
-        for i, load in enumerate(loads):
-            try:
-                R, pos = rlt.create_rotation_matrix(
-                    np.radians(load['euler_angles']),
-                    load['rotation_order'],
-                    load['translation']
-                )
-                
-                # Add coordinate system
-                fig_load = plot3d.plot_triad(
-                    np.radians(load['euler_angles']),
-                    load['rotation_order'],
-                    load['translation'],
-                    tip_size=0.5,
-                    len_triad=1,
-                    colors_arr='#3498db',
-                    triad_name=f"{load['name']}:InputCSYS"
-                )
-                fig.add_traces(fig_load.data)
-                
-                # Add vectors
-                if 'force' in load:
-                    fig_force = plot3d.create_vector(
-                        pos, R @ load['force'], '#e74c3c',
-                        f"Force:{load['force']}", triad_name=f"{load['name']}:Force"
-                    )
-                    fig.add_traces(fig_force.data)
-                
-                if 'moment' in load:
-                    fig_mom = plot3d.create_vector(
-                        pos, R @ load['moment'], '#2ecc71',
-                        f"Moment:{load['moment']}", triad_name=f"{load['name']}:Moment"
-                    )
-                    fig.add_traces(fig_mom.data)
-                
-            except Exception as e:
-                print(f"Error processing load {i}: {e}")
-        
-        # Process targets and calculate results
-        self.results_table.setRowCount(len(targets))
-        for i, target in enumerate(targets):
-            try:
-                R_target, pos_target = rlt.create_rotation_matrix(
-                    np.radians(target['euler_angles']),
-                    target['rotation_order'],
-                    target['translation']
-                )
-                
-                # Add coordinate system
-                fig_target = plot3d.plot_triad(
-                    np.radians(target['euler_angles']),
-                    target['rotation_order'],
-                    target['translation'],
-                    tip_size=0.5,
-                    len_triad=1,
-                    colors_arr='#f1c40f',
-                    triad_name=f"{target['name']}:OutCSYS"
-                )
-                fig.add_traces(fig_target.data)
-                
-                # Calculate results
-                total_F, total_M = np.zeros(3), np.zeros(3)
-                for load in loads:
-                    R_load, pos_load = rlt.create_rotation_matrix(
-                        np.radians(load['euler_angles']),
-                        load['rotation_order'],
-                        load['translation']
-                    )
-                    F, M = rlt.rigid_load_transfer(
-                        np.array(load['force']),
-                        np.array(load['moment']),
-                        R_load, pos_load,
-                        R_target, pos_target
-                    )
-                    total_F += F
-                    total_M += M
-                
-                # Update results table
-                self.results_table.setItem(i, 0, QTableWidgetItem(target['name']))
-                for col, val in enumerate(total_F, 1):
-                    self.results_table.setItem(i, col, QTableWidgetItem(f"{val:.2f}"))
-                for col, val in enumerate(total_M, 4):
-                    self.results_table.setItem(i, col, QTableWidgetItem(f"{val:.2f}"))
-                
-            except Exception as e:
-                print(f"Error processing target {i}: {e}")
-        
-        # Update plot layout
-        fig.update_layout(
-            scene=dict(
-                xaxis=dict(title='X'),
-                yaxis=dict(title='Y'),
-                zaxis=dict(title='Z'),
-                aspectmode='cube',
-                camera=dict(up=dict(x=0, y=0, z=1))
-            ),
-            margin=dict(l=0, r=0, b=0, t=30),
-            showlegend=True,
-            scene_aspectmode='data'
+        self._plot_generation += 1
+        worker = PlotWorker(self._plot_generation, self.plot_figure, loads, targets, categories)
+        worker.signals.finished.connect(self.on_plot_built)
+        # Builds still queued are out of date now
+        self.plot_pool.clear()
+        self.plot_pool.start(worker)
+    
+    def on_plot_built(self, generation, figure_json, result_rows, trace_indices):
+        if generation != self._plot_generation:
+            return  # a newer update is on its way
+        self.update_results_table(result_rows)
+        if trace_indices is None:
+            self.show_figure(figure_json)
+        elif self._plot_page_ready and self._pending_figure_json is None:
+            self.update_traces(figure_json, trace_indices)
+        else:
+            # Nothing drawn yet to update in place; draw the whole figure instead
+            self._redraw_all = True
+            self.update_plot()
+            return
+        self._redraw_all = False
+        self._redraw_categories.clear()
+    
+    def update_results_table(self, rows):
+        """Show rows of cell texts, reusing the table's items; None rows are left as they are"""
+        table = self.results_table
+        table.setUpdatesEnabled(False)
+        try:
+            if table.rowCount() != len(rows):
+                table.setRowCount(len(rows))
+                # Items of removed rows were deleted along with them
+                del self._result_items[len(rows):]
+            while len(self._result_items) < len(rows):
+                row = len(self._result_items)
+                items = [QTableWidgetItem() for _ in range(table.columnCount())]
+                for col, item in enumerate(items):
+                    table.setItem(row, col, item)
+                self._result_items.append(items)
+            
+            for items, texts in zip(self._result_items, rows):
+                if texts is None:
+                    continue
+                for item, text in zip(items, texts):
+                    if item.text() != text:
+                        item.setText(text)
+        finally:
+            table.setUpdatesEnabled(True)
+    
+    def init_plot_view(self):
+        """Swap the placeholder for the web view; the page is loaded once and updated in place"""
+        from PySide6.QtWebEngineWidgets import QWebEngineView
+        self.web_view = QWebEngineView()
+        self.web_view.loadFinished.connect(self.on_plot_page_loaded)
+        plotly_js = plotly_js_file()
+        self.web_view.setHtml(
+            PLOT_PAGE_HTML.format(plotly_js=os.path.basename(plotly_js)),
+            QUrl.fromLocalFile(os.path.dirname(plotly_js) + os.sep)
+        )
+        self.right_layout.replaceWidget(self.plot_placeholder, self.web_view)
+        self.plot_placeholder.deleteLater()
+        self.plot_placeholder = None
+    
+    def on_plot_page_loaded(self, ok):
+        self._plot_page_ready = ok
+        if ok and self._pending_figure_json is not None:
+            self.show_figure(self._pending_figure_json)
+            self._pending_figure_json = None
+    
+    def show_figure(self, figure_json):
+        """Draw a figure (as JSON) into the loaded plot page without reloading it"""
+        if not self._plot_page_ready:
+            self._pending_figure_json = figure_json
+            return
+        self.web_view.page().runJavaScript(
+            f"(function(fig) {{ Plotly.react('gd', fig.data, fig.layout, {{responsive: true}}); }})({figure_json});"
+        )
+    
+    def update_traces(self, figure_json, trace_indices):
+        """Replace only the given traces of the drawn figure with those of figure_json"""
+        self.web_view.page().runJavaScript(
+            "(function(fig, indices) {"
+            " var gd = document.getElementById('gd'); var data = gd.data.slice();"
+            " indices.forEach(function(index, k) { data[index] = fig.data[k]; });"
+            " Plotly.react(gd, data, gd.layout);"
+            f" }})({figure_json}, {json.dumps(trace_indices)});"
         )
-        
-        # Display plot in web view
-        self.web_view.setHtml(fig.to_html(include_plotlyjs='cdn'))
 
 if __name__ == "__main__":
+    # Needed by Qt WebEngine, which is only imported after the application exists
+    QApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
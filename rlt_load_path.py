@@ -1,20 +1,23 @@
 import sys
 import json
+import math
 import numpy as np
+from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QLineEdit, QScrollArea, QFileDialog,
     QTableWidget, QTableWidgetItem, QSplitter, QComboBox,
     QGroupBox, QMessageBox, QHeaderView, QToolBar, QStatusBar,
-    QTabWidget, QGraphicsView, QGraphicsScene, QGraphicsEllipseItem,
-    QGraphicsLineItem, QGraphicsTextItem, QListWidget, QListWidgetItem,
+    QTabWidget, QGraphicsView, QGraphicsScene, QGraphicsItem, QStyle,
+    QGraphicsLineItem, QListWidget, QListWidgetItem,
     QDialog, QDialogButtonBox, QTextEdit, QCheckBox, QSpinBox, QDoubleSpinBox,
     QInputDialog, QProgressDialog, QMenuBar, QMenu, QDockWidget, QFrame
 )
 from PySide6.QtWebEngineWidgets import QWebEngineView
 from PySide6.QtCore import Qt, Signal, QObject, QTimer, QPointF, QRectF, QLineF, QSettings, QThread
-from PySide6.QtGui import QFont, QAction, QPen, QBrush, QColor, QPainter, QKeySequence, QIcon
+from PySide6.QtGui import QFont, QAction, QPen, QBrush, QColor, QPainter, QPainterPath, QPixmap, QKeySequence, QIcon
 import plotly.graph_objects as go
 import rigid_load_transfer as rlt
 import plot_3d as plot3d
@@ -388,50 +391,120 @@ class PreferencesDialog(QDialog):
 
 
 # ===================== NODE GRAPH VISUALIZATION =====================
-class NodeGraphicsItem(QGraphicsEllipseItem):
+# Paint resources shared by all graph items instead of one copy per item.
+# Built on first use, since Qt wants its application to exist by then
+@lru_cache(maxsize=64)
+def _color(name):
+    return QColor(name)
+
+@lru_cache(maxsize=64)
+def _pen(color, width, style=Qt.SolidLine):
+    return QPen(_color(color), width, style)
+
+@lru_cache(maxsize=64)
+def _brush(color):
+    return QBrush(_color(color))
+
+@lru_cache(maxsize=None)
+def _node_label_font():
+    return QFont("Arial", 10, QFont.Bold)
+
+
+class NodeGraphicsItem(QGraphicsItem):
     """Interactive node representation in the graph view"""
+    # Circle and label are painted by this one item rather than an ellipse
+    # item plus a child text item, halving the items the scene tracks
+    _ELLIPSE = QRectF(-30, -30, 60, 60)
+    _BOUNDS = _ELLIPSE.adjusted(-1, -1, 1, 1)  # half the border pen's width
+    
     def __init__(self, node_id, name, color, x, y, parent_view):
-        super().__init__(-30, -30, 60, 60)
+        super().__init__()
         self.node_id = node_id
         self.node_name = name
         self.parent_view = parent_view
-        self.edges = []  # Initialize edges list BEFORE setting flags
+        self.edges = set()  # Initialize edges set BEFORE setting flags
         
         # Set appearance
-        self.setBrush(QBrush(QColor(color)))
-        self.setPen(QPen(QColor("#2c3e50"), 2))
-        self.setFlag(QGraphicsEllipseItem.ItemIsMovable)
-        self.setFlag(QGraphicsEllipseItem.ItemIsSelectable)
-        self.setFlag(QGraphicsEllipseItem.ItemSendsGeometryChanges)
+        self._fill = _brush(color)
+        self.setFlag(QGraphicsItem.ItemIsMovable)
+        self.setFlag(QGraphicsItem.ItemIsSelectable)
+        self.setFlag(QGraphicsItem.ItemSendsGeometryChanges)
+        # Reuse the rendered node (ellipse and label) while it is only moved
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         self.setPos(x, y)
         
-        # Add text label
-        self.text_item = QGraphicsTextItem(name, self)
-        self.text_item.setDefaultTextColor(QColor("white"))
-        self.text_item.setFont(QFont("Arial", 10, QFont.Bold))
-        text_rect = self.text_item.boundingRect()
-        self.text_item.setPos(-text_rect.width()/2, -text_rect.height()/2)
+    def set_name(self, name):
+        """Change the label drawn on the node"""
+        self.node_name = name
+        self.update()
+        
+    def boundingRect(self):
+        return self._BOUNDS
+    
+    def shape(self):
+        path = QPainterPath()
+        path.addEllipse(self._ELLIPSE)
+        return path
+    
+    def paint(self, painter, option, widget=None):
+        painter.setPen(_pen("#2c3e50", 2))
+        painter.setBrush(self._fill)
+        painter.drawEllipse(self._ELLIPSE)
+        painter.setFont(_node_label_font())
+        painter.setPen(_color("white"))
+        painter.drawText(self._ELLIPSE, Qt.AlignCenter, self.node_name)
+        if option.state & QStyle.State_Selected:
+            # Dashed outline, as the stock ellipse item drew for selection
+            painter.setPen(_pen("#2c3e50", 1, Qt.DashLine))
+            painter.setBrush(Qt.NoBrush)
+            painter.drawRect(self._ELLIPSE)
         
     def add_edge(self, edge):
         """Add connected edge for updating"""
-        self.edges.append(edge)
+        self.edges.add(edge)
         
     def itemChange(self, change, value):
         """Update connected edges when node moves"""
-        if change == QGraphicsEllipseItem.ItemPositionHasChanged:
-            for edge in self.edges:
-                edge.update_position()
+        if change == QGraphicsItem.ItemPositionHasChanged:
+            self.parent_view.schedule_edge_updates(self.edges)
         return super().itemChange(change, value)
     
     def mousePressEvent(self, event):
-        """Handle node selection"""
+        """Handle node selection, Shift+drag starts a connection"""
         if event.button() == Qt.LeftButton:
+            if event.modifiers() & Qt.ShiftModifier:
+                # Keep the mouse grab without moving or selecting the node
+                self.parent_view.start_connection(self.node_id)
+                event.accept()
+                return
             self.parent_view.node_selected(self.node_id)
         super().mousePressEvent(event)
+    
+    def mouseMoveEvent(self, event):
+        """Follow a connection drag, or freeze the rest of the graph once a move starts"""
+        if self.parent_view.connecting:
+            self.parent_view.update_connection(event.scenePos())
+            return
+        if event.buttons() & Qt.LeftButton:
+            self.parent_view.begin_drag(self)
+        super().mouseMoveEvent(event)
+    
+    def mouseReleaseEvent(self, event):
+        if self.parent_view.connecting:
+            self.parent_view.finish_connection(event.scenePos())
+            return
+        self.parent_view.end_drag()
+        super().mouseReleaseEvent(event)
 
 
 class EdgeGraphicsItem(QGraphicsLineItem):
     """Edge representation connecting two nodes"""
+    NODE_RADIUS = 30
+    ARROW_SIZE = 10
+    # The arrow head's barb is the edge direction turned by 30 degrees
+    _ARROW_COS = math.cos(math.pi/6)
+    _ARROW_SIN = math.sin(math.pi/6)
+    
     def __init__(self, edge_id, source_node, target_node, color="#555"):
         super().__init__()
         self.edge_id = edge_id
@@ -439,13 +512,14 @@ class EdgeGraphicsItem(QGraphicsLineItem):
         self.target_node = target_node
         
         # Set appearance
-        pen = QPen(QColor(color), 3)
-        pen.setStyle(Qt.SolidLine)
-        self.setPen(pen)
+        self.setPen(_pen(color, 3))
+        
+        # Node positions of the last update, (source x, y, target x, y)
+        self._last_positions = None
         
         # Add arrow head
         self.arrow_head = QGraphicsLineItem(self)
-        self.arrow_head.setPen(QPen(QColor(color), 2))
+        self.arrow_head.setPen(_pen(color, 2))
         
         # Register with nodes
         source_node.add_edge(self)
@@ -457,44 +531,71 @@ class EdgeGraphicsItem(QGraphicsLineItem):
         """Update line position based on node positions"""
         source_pos = self.source_node.pos()
         target_pos = self.target_node.pos()
+        source_x, source_y = source_pos.x(), source_pos.y()
+        target_x, target_y = target_pos.x(), target_pos.y()
+        
+        # Nothing to redo if neither end moved by half a pixel or more
+        positions = (source_x, source_y, target_x, target_y)
+        if self._last_positions is not None and all(
+                abs(new - old) < 0.5 for new, old in zip(positions, self._last_positions)):
+            return
+        self._last_positions = positions
+        
+        dx = target_x - source_x
+        dy = target_y - source_y
+        
+        # Overlapping nodes leave no line between their circles to draw
+        radius = self.NODE_RADIUS
+        length_sq = dx*dx + dy*dy
+        if length_sq <= (2*radius)**2:
+            self.setVisible(False)
+            return
+        self.setVisible(True)
         
         # Calculate line endpoints at circle boundaries
-        line = QLineF(source_pos, target_pos)
-        length = line.length()
+        inv_length = 1.0 / math.sqrt(length_sq)
+        unit_x = dx * inv_length
+        unit_y = dy * inv_length
         
-        if length > 0:
-            # Calculate intersection points with circles (radius 30)
-            unit_x = (target_pos.x() - source_pos.x()) / length
-            unit_y = (target_pos.y() - source_pos.y()) / length
-            
-            start_x = source_pos.x() + unit_x * 30
-            start_y = source_pos.y() + unit_y * 30
-            end_x = target_pos.x() - unit_x * 30
-            end_y = target_pos.y() - unit_y * 30
-            
-            self.setLine(start_x, start_y, end_x, end_y)
-            
-            # Update arrow head
-            arrow_size = 10
-            angle = np.arctan2(end_y - start_y, end_x - start_x)
-            
-            arrow_p1_x = end_x - arrow_size * np.cos(angle - np.pi/6)
-            arrow_p1_y = end_y - arrow_size * np.sin(angle - np.pi/6)
-            
-            self.arrow_head.setLine(end_x, end_y, arrow_p1_x, arrow_p1_y)
+        start_x = source_x + unit_x * radius
+        start_y = source_y + unit_y * radius
+        end_x = target_x - unit_x * radius
+        end_y = target_y - unit_y * radius
+        
+        self.setLine(start_x, start_y, end_x, end_y)
+        
+        # Update arrow head: the unit direction rotated by -30 degrees, no trig needed
+        arrow_p1_x = end_x - self.ARROW_SIZE * (unit_x*self._ARROW_COS + unit_y*self._ARROW_SIN)
+        arrow_p1_y = end_y - self.ARROW_SIZE * (unit_y*self._ARROW_COS - unit_x*self._ARROW_SIN)
+        
+        self.arrow_head.setLine(end_x, end_y, arrow_p1_x, arrow_p1_y)
 
 
 class GraphView(QGraphicsView):
     """Custom graphics view for node-edge graph"""
     node_selected_signal = Signal(str)
     graph_changed_signal = Signal()
+    connection_requested_signal = Signal(str, str)  # source id, target id
     
-    def __init__(self):
+    def __init__(self, full_viewport_update=False, use_opengl=False, freeze_background=False):
         super().__init__()
         self.scene = QGraphicsScene()
         self.setScene(self.scene)
+        # Rasterize on the GPU when asked to and Qt was built with OpenGL;
+        # otherwise stay on the default raster viewport
+        if use_opengl:
+            try:
+                from PySide6.QtOpenGLWidgets import QOpenGLWidget
+            except ImportError:
+                pass
+            else:
+                self.setViewport(QOpenGLWidget())
         self.setRenderHint(QPainter.Antialiasing)
-        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        # Only repaint around what changed; full repaints are kept for debugging
+        if full_viewport_update:
+            self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        else:
+            self.setViewportUpdateMode(QGraphicsView.BoundingRectViewportUpdate)
         
         # Set scene size
         self.scene.setSceneRect(-400, -300, 800, 600)
@@ -502,10 +603,26 @@ class GraphView(QGraphicsView):
         # Storage
         self.nodes = {}  # node_id -> NodeGraphicsItem
         self.edges = {}  # edge_id -> EdgeGraphicsItem
+        self.edges_by_node = defaultdict(set)  # node_id -> ids of its edges
         
-        # Connection state
+        # Connection state, the rubber band is a scene-only preview line
         self.connecting = False
         self.connection_start_node = None
+        self._rubber_band = None
+        
+        # Edges of moved nodes are redrawn at most once per frame
+        self._dirty_edges = set()
+        self._edge_update_timer = QTimer(self)
+        self._edge_update_timer.setSingleShot(True)
+        self._edge_update_timer.setInterval(16)
+        self._edge_update_timer.timeout.connect(self._flush_edge_updates)
+        
+        # While a node is dragged the untouched items can be painted once into
+        # a pixmap drawn as the background, leaving only the dragged nodes and
+        # their edges to repaint per frame
+        self.freeze_background = freeze_background
+        self._frozen_pixmap = None
+        self._frozen_items = []
         
         # Styling
         self.setStyleSheet("""
@@ -518,20 +635,97 @@ class GraphView(QGraphicsView):
         
     def node_selected(self, node_id):
         """Handle node selection"""
-        if self.connecting:
-            # Second click - create connection
-            if self.connection_start_node and self.connection_start_node != node_id:
-                self.graph_changed_signal.emit()
-                self.connecting = False
-                self.connection_start_node = None
-        else:
-            # First click - select node or start connection
-            self.node_selected_signal.emit(node_id)
+        self.node_selected_signal.emit(node_id)
             
+    def schedule_edge_updates(self, edges):
+        """Queue edges for the next batched position update"""
+        self._dirty_edges.update(edges)
+        if not self._edge_update_timer.isActive():
+            self._edge_update_timer.start()
+    
+    def _flush_edge_updates(self):
+        dirty_edges, self._dirty_edges = self._dirty_edges, set()
+        for edge in dirty_edges:
+            edge.update_position()
+    
+    def begin_drag(self, node):
+        """Render everything not moving with the drag into the frozen background"""
+        if not self.freeze_background or self._frozen_pixmap is not None:
+            return
+        # The pressed node moves together with any other selected nodes
+        moving = {node} | {item for item in self.nodes.values() if item.isSelected()}
+        active = set(moving)
+        for moving_node in moving:
+            active.update(moving_node.edges)
+        static = [item for item in self.scene.items()
+                  if item.parentItem() is None and item not in active and item.isVisible()]
+        if not static:
+            return
+        
+        # Paint the static items alone, then leave only the active ones in the scene;
+        # active edges hidden over overlapping nodes must stay hidden afterwards
+        was_visible = {item: item.isVisible() for item in active}
+        for item in active:
+            item.setVisible(False)
+        ratio = self.viewport().devicePixelRatio()
+        pixmap = QPixmap(self.viewport().size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        self.render(painter, QRectF(self.viewport().rect()), self.viewport().rect())
+        painter.end()
+        for item, visible in was_visible.items():
+            item.setVisible(visible)
+        for item in static:
+            item.setVisible(False)
+        self._frozen_pixmap = pixmap
+        self._frozen_items = static
+        self.viewport().update()
+    
+    def end_drag(self):
+        """Put the frozen items back into the scene"""
+        if self._frozen_pixmap is None:
+            return
+        for item in self._frozen_items:
+            item.setVisible(True)
+        self._frozen_pixmap = None
+        self._frozen_items = []
+        self.viewport().update()
+    
+    def drawBackground(self, painter, rect):
+        super().drawBackground(painter, rect)
+        if self._frozen_pixmap is not None:
+            painter.save()
+            painter.resetTransform()
+            painter.drawPixmap(0, 0, self._frozen_pixmap)
+            painter.restore()
+    
     def start_connection(self, node_id):
-        """Start connection mode"""
+        """Start dragging a connection out of a node"""
         self.connecting = True
         self.connection_start_node = node_id
+        start = self.nodes[node_id].pos()
+        self._rubber_band = QGraphicsLineItem(QLineF(start, start))
+        self._rubber_band.setPen(_pen("#7f8c8d", 2, Qt.DashLine))
+        self.scene.addItem(self._rubber_band)
+    
+    def update_connection(self, scene_pos):
+        """Move the free end of the rubber band; nothing is recalculated"""
+        if self._rubber_band is not None:
+            self._rubber_band.setLine(QLineF(self._rubber_band.line().p1(), scene_pos))
+    
+    def finish_connection(self, scene_pos):
+        """Request the connection if released over another node"""
+        if self._rubber_band is not None:
+            self.scene.removeItem(self._rubber_band)
+            self._rubber_band = None
+        source_id = self.connection_start_node
+        self.connecting = False
+        self.connection_start_node = None
+        target = self.node_at(scene_pos)
+        if target is not None and target.node_id != source_id:
+            self.connection_requested_signal.emit(source_id, target.node_id)
         
     def add_node(self, node_id, name, color, x=0, y=0):
         """Add node to graph"""
@@ -548,33 +742,61 @@ class GraphView(QGraphicsView):
             edge_item = EdgeGraphicsItem(edge_id, source_node, target_node, color)
             self.scene.addItem(edge_item)
             self.edges[edge_id] = edge_item
+            self.edges_by_node[source_id].add(edge_id)
+            self.edges_by_node[target_id].add(edge_id)
             
     def remove_node(self, node_id):
         """Remove node and connected edges"""
         if node_id in self.nodes:
-            node = self.nodes[node_id]
-            # Remove connected edges
-            for edge in list(node.edges):
-                if edge.edge_id in self.edges:
-                    self.scene.removeItem(edge)
-                    del self.edges[edge.edge_id]
+            # Remove connected edges, found through the index
+            for edge_id in self.edges_by_node.pop(node_id, set()):
+                self.remove_edge(edge_id)
             # Remove node
-            self.scene.removeItem(node)
-            del self.nodes[node_id]
+            self.scene.removeItem(self.nodes.pop(node_id))
             
     def remove_edge(self, edge_id):
         """Remove edge"""
         if edge_id in self.edges:
-            edge = self.edges[edge_id]
+            edge = self.edges.pop(edge_id)
             self.scene.removeItem(edge)
-            del self.edges[edge_id]
-            
+            self._dirty_edges.discard(edge)
+            for node in (edge.source_node, edge.target_node):
+                node.edges.discard(edge)
+                node_edge_ids = self.edges_by_node.get(node.node_id)
+                if node_edge_ids is not None:
+                    node_edge_ids.discard(edge_id)
+            
+    def rename_edge(self, old_id, new_id):
+        """Re-key an edge under a new id"""
+        if old_id in self.edges:
+            edge = self.edges.pop(old_id)
+            edge.edge_id = new_id
+            self.edges[new_id] = edge
+            for node in (edge.source_node, edge.target_node):
+                node_edge_ids = self.edges_by_node[node.node_id]
+                node_edge_ids.discard(old_id)
+                node_edge_ids.add(new_id)
+    
     def clear_graph(self):
         """Clear all nodes and edges"""
+        self._frozen_pixmap = None
+        self._frozen_items = []
+        self._rubber_band = None
+        self.connecting = False
+        self.connection_start_node = None
         self.scene.clear()
         self.nodes.clear()
         self.edges.clear()
-        
+        self.edges_by_node.clear()
+        self._dirty_edges.clear()
+        
+    def node_at(self, scene_pos):
+        """Topmost node under a scene position, or None"""
+        for item in self.scene.items(scene_pos):
+            if isinstance(item, NodeGraphicsItem):
+                return item
+        return None
+    
     def get_node_positions(self):
         """Get current positions of all nodes"""
         positions = {}
@@ -584,6 +806,22 @@ class GraphView(QGraphicsView):
         return positions
 
 
+# ===================== DIALOG HELPERS =====================
+def _make_xyz_row(range_, values=(0, 0, 0), decimals=3, labels=("X:", "Y:", "Z:")):
+    """Row of three labelled spin boxes with a shared +/-range_, returns (layout, spins)"""
+    row = QHBoxLayout()
+    spins = []
+    for label, value in zip(labels, values):
+        spin = QDoubleSpinBox()
+        spin.setRange(-range_, range_)
+        spin.setDecimals(decimals)
+        spin.setValue(value)
+        row.addWidget(QLabel(label))
+        row.addWidget(spin)
+        spins.append(spin)
+    return row, spins
+
+
 # ===================== EDGE PROPERTIES DIALOG =====================
 class EdgePropertiesDialog(QDialog):
     """Dialog for editing edge interface properties"""
@@ -610,28 +848,13 @@ class EdgePropertiesDialog(QDialog):
             info_label.setStyleSheet("font-weight: bold; font-size: 11px; color: #7f8c8d; margin-bottom: 10px;")
             layout.addWidget(info_label)
         
+        interface = edge_data.get('interface_properties', {}) if edge_data else {}
+        
         # Interface position (output coordinate system location)
         pos_group = QGroupBox("Interface Position (X, Y, Z)")
         pos_group.setToolTip("Location of the output coordinate system on the edge")
-        pos_layout = QHBoxLayout()
-        self.pos_x = QDoubleSpinBox()
-        self.pos_y = QDoubleSpinBox()
-        self.pos_z = QDoubleSpinBox()
-        for spin in [self.pos_x, self.pos_y, self.pos_z]:
-            spin.setRange(-10000, 10000)
-            spin.setDecimals(3)
-        if edge_data:
-            interface = edge_data.get('interface_properties', {})
-            pos = interface.get('position', [0, 0, 0])
-            self.pos_x.setValue(pos[0])
-            self.pos_y.setValue(pos[1])
-            self.pos_z.setValue(pos[2])
-        pos_layout.addWidget(QLabel("X:"))
-        pos_layout.addWidget(self.pos_x)
-        pos_layout.addWidget(QLabel("Y:"))
-        pos_layout.addWidget(self.pos_y)
-        pos_layout.addWidget(QLabel("Z:"))
-        pos_layout.addWidget(self.pos_z)
+        pos_layout, (self.pos_x, self.pos_y, self.pos_z) = _make_xyz_row(
+            10000, interface.get('position', [0, 0, 0]))
         pos_group.setLayout(pos_layout)
         layout.addWidget(pos_group)
         
@@ -644,32 +867,13 @@ class EdgePropertiesDialog(QDialog):
         rot_order_layout.addWidget(QLabel("Order:"))
         self.rot_order = QComboBox()
         self.rot_order.addItems(['xyz', 'xzy', 'yxz', 'yzx', 'zxy', 'zyx'])
-        if edge_data:
-            interface = edge_data.get('interface_properties', {})
-            self.rot_order.setCurrentText(interface.get('rotation_order', 'xyz'))
+        self.rot_order.setCurrentText(interface.get('rotation_order', 'xyz'))
         rot_order_layout.addWidget(self.rot_order)
         rot_order_layout.addStretch()
         rot_layout.addLayout(rot_order_layout)
         
-        rot_angles_layout = QHBoxLayout()
-        self.rot_x = QDoubleSpinBox()
-        self.rot_y = QDoubleSpinBox()
-        self.rot_z = QDoubleSpinBox()
-        for spin in [self.rot_x, self.rot_y, self.rot_z]:
-            spin.setRange(-360, 360)
-            spin.setDecimals(3)
-        if edge_data:
-            interface = edge_data.get('interface_properties', {})
-            angles = interface.get('euler_angles', [0, 0, 0])
-            self.rot_x.setValue(angles[0])
-            self.rot_y.setValue(angles[1])
-            self.rot_z.setValue(angles[2])
-        rot_angles_layout.addWidget(QLabel("X:"))
-        rot_angles_layout.addWidget(self.rot_x)
-        rot_angles_layout.addWidget(QLabel("Y:"))
-        rot_angles_layout.addWidget(self.rot_y)
-        rot_angles_layout.addWidget(QLabel("Z:"))
-        rot_angles_layout.addWidget(self.rot_z)
+        rot_angles_layout, (self.rot_x, self.rot_y, self.rot_z) = _make_xyz_row(
+            360, interface.get('euler_angles', [0, 0, 0]))
         rot_layout.addLayout(rot_angles_layout)
         rot_group.setLayout(rot_layout)
         layout.addWidget(rot_group)
@@ -711,34 +915,19 @@ class NodePropertiesDialog(QDialog):
         self.setMinimumWidth(500)
         
         layout = QVBoxLayout()
+        node_data = node_data or {}
         
         # Name
         name_layout = QHBoxLayout()
         name_layout.addWidget(QLabel("Name:"))
-        self.name_input = QLineEdit(node_data.get('name', 'New Node') if node_data else 'New Node')
+        self.name_input = QLineEdit(node_data.get('name', 'New Node'))
         name_layout.addWidget(self.name_input)
         layout.addLayout(name_layout)
         
         # Position
         pos_group = QGroupBox("Position (X, Y, Z)")
-        pos_layout = QHBoxLayout()
-        self.pos_x = QDoubleSpinBox()
-        self.pos_y = QDoubleSpinBox()
-        self.pos_z = QDoubleSpinBox()
-        for spin in [self.pos_x, self.pos_y, self.pos_z]:
-            spin.setRange(-10000, 10000)
-            spin.setDecimals(3)
-        if node_data:
-            trans = node_data.get('translation', [0, 0, 0])
-            self.pos_x.setValue(trans[0])
-            self.pos_y.setValue(trans[1])
-            self.pos_z.setValue(trans[2])
-        pos_layout.addWidget(QLabel("X:"))
-        pos_layout.addWidget(self.pos_x)
-        pos_layout.addWidget(QLabel("Y:"))
-        pos_layout.addWidget(self.pos_y)
-        pos_layout.addWidget(QLabel("Z:"))
-        pos_layout.addWidget(self.pos_z)
+        pos_layout, (self.pos_x, self.pos_y, self.pos_z) = _make_xyz_row(
+            10000, node_data.get('translation', [0, 0, 0]))
         pos_group.setLayout(pos_layout)
         layout.addWidget(pos_group)
         
@@ -749,29 +938,12 @@ class NodePropertiesDialog(QDialog):
         rot_order_layout.addWidget(QLabel("Order:"))
         self.rot_order = QComboBox()
         self.rot_order.addItems(['xyz', 'xzy', 'yxz', 'yzx', 'zxy', 'zyx'])
-        if node_data:
-            self.rot_order.setCurrentText(node_data.get('rotation_order', 'xyz'))
+        self.rot_order.setCurrentText(node_data.get('rotation_order', 'xyz'))
         rot_order_layout.addWidget(self.rot_order)
         rot_layout.addLayout(rot_order_layout)
         
-        rot_angles_layout = QHBoxLayout()
-        self.rot_x = QDoubleSpinBox()
-        self.rot_y = QDoubleSpinBox()
-        self.rot_z = QDoubleSpinBox()
-        for spin in [self.rot_x, self.rot_y, self.rot_z]:
-            spin.setRange(-360, 360)
-            spin.setDecimals(3)
-        if node_data:
-            angles = node_data.get('euler_angles', [0, 0, 0])
-            self.rot_x.setValue(angles[0])
-            self.rot_y.setValue(angles[1])
-            self.rot_z.setValue(angles[2])
-        rot_angles_layout.addWidget(QLabel("X:"))
-        rot_angles_layout.addWidget(self.rot_x)
-        rot_angles_layout.addWidget(QLabel("Y:"))
-        rot_angles_layout.addWidget(self.rot_y)
-        rot_angles_layout.addWidget(QLabel("Z:"))
-        rot_angles_layout.addWidget(self.rot_z)
+        rot_angles_layout, (self.rot_x, self.rot_y, self.rot_z) = _make_xyz_row(
+            360, node_data.get('euler_angles', [0, 0, 0]))
         rot_layout.addLayout(rot_angles_layout)
         rot_group.setLayout(rot_layout)
         layout.addWidget(rot_group)
@@ -784,76 +956,27 @@ class NodePropertiesDialog(QDialog):
         self.mass_input = QDoubleSpinBox()
         self.mass_input.setRange(0, 100000)
         self.mass_input.setDecimals(3)
-        if node_data:
-            self.mass_input.setValue(node_data.get('mass', 0))
+        self.mass_input.setValue(node_data.get('mass', 0))
         mass_input_layout.addWidget(self.mass_input)
         mass_layout.addLayout(mass_input_layout)
         
-        cog_layout = QHBoxLayout()
-        self.cog_x = QDoubleSpinBox()
-        self.cog_y = QDoubleSpinBox()
-        self.cog_z = QDoubleSpinBox()
-        for spin in [self.cog_x, self.cog_y, self.cog_z]:
-            spin.setRange(-10000, 10000)
-            spin.setDecimals(3)
-        if node_data:
-            cog = node_data.get('cog', [0, 0, 0])
-            self.cog_x.setValue(cog[0])
-            self.cog_y.setValue(cog[1])
-            self.cog_z.setValue(cog[2])
-        cog_layout.addWidget(QLabel("CoG X:"))
-        cog_layout.addWidget(self.cog_x)
-        cog_layout.addWidget(QLabel("Y:"))
-        cog_layout.addWidget(self.cog_y)
-        cog_layout.addWidget(QLabel("Z:"))
-        cog_layout.addWidget(self.cog_z)
+        cog_layout, (self.cog_x, self.cog_y, self.cog_z) = _make_xyz_row(
+            10000, node_data.get('cog', [0, 0, 0]), labels=("CoG X:", "Y:", "Z:"))
         mass_layout.addLayout(cog_layout)
         mass_group.setLayout(mass_layout)
         layout.addWidget(mass_group)
         
         # Forces
         force_group = QGroupBox("External Force")
-        force_layout = QHBoxLayout()
-        self.force_x = QDoubleSpinBox()
-        self.force_y = QDoubleSpinBox()
-        self.force_z = QDoubleSpinBox()
-        for spin in [self.force_x, self.force_y, self.force_z]:
-            spin.setRange(-100000, 100000)
-            spin.setDecimals(3)
-        if node_data:
-            force = node_data.get('external_force', [0, 0, 0])
-            self.force_x.setValue(force[0])
-            self.force_y.setValue(force[1])
-            self.force_z.setValue(force[2])
-        force_layout.addWidget(QLabel("X:"))
-        force_layout.addWidget(self.force_x)
-        force_layout.addWidget(QLabel("Y:"))
-        force_layout.addWidget(self.force_y)
-        force_layout.addWidget(QLabel("Z:"))
-        force_layout.addWidget(self.force_z)
+        force_layout, (self.force_x, self.force_y, self.force_z) = _make_xyz_row(
+            100000, node_data.get('external_force', [0, 0, 0]))
         force_group.setLayout(force_layout)
         layout.addWidget(force_group)
         
         # Moments
         moment_group = QGroupBox("External Moment")
-        moment_layout = QHBoxLayout()
-        self.moment_x = QDoubleSpinBox()
-        self.moment_y = QDoubleSpinBox()
-        self.moment_z = QDoubleSpinBox()
-        for spin in [self.moment_x, self.moment_y, self.moment_z]:
-            spin.setRange(-100000, 100000)
-            spin.setDecimals(3)
-        if node_data:
-            moment = node_data.get('moment', [0, 0, 0])
-            self.moment_x.setValue(moment[0])
-            self.moment_y.setValue(moment[1])
-            self.moment_z.setValue(moment[2])
-        moment_layout.addWidget(QLabel("X:"))
-        moment_layout.addWidget(self.moment_x)
-        moment_layout.addWidget(QLabel("Y:"))
-        moment_layout.addWidget(self.moment_y)
-        moment_layout.addWidget(QLabel("Z:"))
-        moment_layout.addWidget(self.moment_z)
+        moment_layout, (self.moment_x, self.moment_y, self.moment_z) = _make_xyz_row(
+            100000, node_data.get('moment', [0, 0, 0]))
         moment_group.setLayout(moment_layout)
         layout.addWidget(moment_group)
         
@@ -891,6 +1014,7 @@ class IntegratedLoadTransferApp(QMainWindow):
         self.update_timer = QTimer()
         self.update_timer.setSingleShot(True)
         self.update_timer.timeout.connect(self.update_visualization)
+        self._last_fingerprint = None  # state the current plot was built from
         
         # Initialize managers
         self.units_manager = UnitsManager()
@@ -1116,6 +1240,9 @@ class IntegratedLoadTransferApp(QMainWindow):
         self.gravity_input.setRange(0, 20)
         self.gravity_input.setValue(9.81)
         self.gravity_input.setDecimals(2)
+        # Typed values only count once confirmed (Enter or focus out), the
+        # arrows still apply each step
+        self.gravity_input.setKeyboardTracking(False)
         self.gravity_input.valueChanged.connect(self.on_gravity_changed)
         toolbar.addWidget(self.gravity_input)
         
@@ -1127,6 +1254,7 @@ class IntegratedLoadTransferApp(QMainWindow):
         self.gravity_dir_x.setSingleStep(0.1)
         self.gravity_dir_x.setMaximumWidth(60)
         self.gravity_dir_x.setToolTip("Gravity direction X component")
+        self.gravity_dir_x.setKeyboardTracking(False)
         self.gravity_dir_x.valueChanged.connect(self.on_gravity_direction_changed)
         toolbar.addWidget(self.gravity_dir_x)
         
@@ -1137,6 +1265,7 @@ class IntegratedLoadTransferApp(QMainWindow):
         self.gravity_dir_y.setSingleStep(0.1)
         self.gravity_dir_y.setMaximumWidth(60)
         self.gravity_dir_y.setToolTip("Gravity direction Y component")
+        self.gravity_dir_y.setKeyboardTracking(False)
         self.gravity_dir_y.valueChanged.connect(self.on_gravity_direction_changed)
         toolbar.addWidget(self.gravity_dir_y)
         
@@ -1147,6 +1276,7 @@ class IntegratedLoadTransferApp(QMainWindow):
         self.gravity_dir_z.setSingleStep(0.1)
         self.gravity_dir_z.setMaximumWidth(60)
         self.gravity_dir_z.setToolTip("Gravity direction Z component")
+        self.gravity_dir_z.setKeyboardTracking(False)
         self.gravity_dir_z.valueChanged.connect(self.on_gravity_direction_changed)
         toolbar.addWidget(self.gravity_dir_z)
         
@@ -1168,7 +1298,7 @@ class IntegratedLoadTransferApp(QMainWindow):
         
         # Calculate button
         calc_action = QAction("🔄 Calculate", self)
-        calc_action.triggered.connect(self.schedule_update)
+        calc_action.triggered.connect(self.recalculate)
         toolbar.addAction(calc_action)
         
         toolbar.addSeparator()
@@ -1190,9 +1320,12 @@ class IntegratedLoadTransferApp(QMainWindow):
         # Graph view
         graph_group = QGroupBox("Load Path Network")
         graph_layout = QVBoxLayout()
-        self.graph_view = GraphView()
+        self.graph_view = GraphView(
+            use_opengl=self.settings.value('opengl_viewport', False, type=bool),
+            freeze_background=self.settings.value('freeze_graph_background', False, type=bool))
         self.graph_view.node_selected_signal.connect(self.on_node_selected)
         self.graph_view.graph_changed_signal.connect(self.schedule_update)
+        self.graph_view.connection_requested_signal.connect(self.add_connection)
         graph_layout.addWidget(self.graph_view)
         graph_group.setLayout(graph_layout)
         
@@ -1428,7 +1561,7 @@ class IntegratedLoadTransferApp(QMainWindow):
                 # Update graph view
                 if self.selected_node_id in self.graph_view.nodes:
                     node_item = self.graph_view.nodes[self.selected_node_id]
-                    node_item.text_item.setPlainText(node_data['name'])
+                    node_item.set_name(node_data['name'])
                     
                 self.update_node_list()
                 self.update_properties_display()
@@ -1505,35 +1638,37 @@ class IntegratedLoadTransferApp(QMainWindow):
                                   "Cannot connect a node to itself.")
                 return
                 
-            source_id = self.graph_data['nodes'][source_idx]['id']
-            target_id = self.graph_data['nodes'][target_idx]['id']
-            
-            # Check if edge already exists
-            for edge in self.graph_data['edges']:
-                if edge['source'] == source_id and edge['target'] == target_id:
-                    QMessageBox.warning(self, "Edge Exists", 
-                                      "Connection already exists between these nodes.")
-                    return
-                    
-            edge_id = f"e{len(self.graph_data['edges'])}"
-            self.graph_data['edges'].append({
-                'id': edge_id,
-                'source': source_id,
-                'target': target_id,
-                'interface_properties': {
-                    'euler_angles': [0, 0, 0],
-                    'rotation_order': 'xyz',
-                    'position': [0, 0, 0]
-                }
-            })
-            
-            # Add to graph view
-            source_color = self.graph_data['nodes'][source_idx].get('color', '#555')
-            self.graph_view.add_edge(edge_id, source_id, target_id, source_color)
-            
-            self.update_edge_list()
-            self.schedule_update()
-            self.statusBar.showMessage(f"Added connection: {edge_id}", 2000)
+            self.add_connection(self.graph_data['nodes'][source_idx]['id'],
+                                self.graph_data['nodes'][target_idx]['id'])
+    
+    def add_connection(self, source_id, target_id):
+        """Add an edge between two existing nodes"""
+        # Check if edge already exists
+        for edge in self.graph_data['edges']:
+            if edge['source'] == source_id and edge['target'] == target_id:
+                QMessageBox.warning(self, "Edge Exists", 
+                                  "Connection already exists between these nodes.")
+                return
+                
+        edge_id = f"e{len(self.graph_data['edges'])}"
+        self.graph_data['edges'].append({
+            'id': edge_id,
+            'source': source_id,
+            'target': target_id,
+            'interface_properties': {
+                'euler_angles': [0, 0, 0],
+                'rotation_order': 'xyz',
+                'position': [0, 0, 0]
+            }
+        })
+        
+        # Add to graph view
+        source_node = next(n for n in self.graph_data['nodes'] if n['id'] == source_id)
+        self.graph_view.add_edge(edge_id, source_id, target_id, source_node.get('color', '#555'))
+        
+        self.update_edge_list()
+        self.schedule_update()
+        self.statusBar.showMessage(f"Added connection: {edge_id}", 2000)
     
     def edit_edge_interface(self):
         """Edit selected edge interface properties"""
@@ -1566,11 +1701,7 @@ class IntegratedLoadTransferApp(QMainWindow):
                     edge_data['id'] = new_name
                     
                     # Update graph view
-                    if old_id in self.graph_view.edges:
-                        edge_item = self.graph_view.edges[old_id]
-                        del self.graph_view.edges[old_id]
-                        self.graph_view.edges[new_name] = edge_item
-                        edge_item.edge_id = new_name
+                    self.graph_view.rename_edge(old_id, new_name)
                 
                 # Update interface properties
                 if 'interface_properties' not in edge_data:
@@ -1705,11 +1836,7 @@ class IntegratedLoadTransferApp(QMainWindow):
                 edge['id'] = new_name
                 
                 # Update graph view
-                if old_id in self.graph_view.edges:
-                    edge_item = self.graph_view.edges[old_id]
-                    del self.graph_view.edges[old_id]
-                    self.graph_view.edges[new_name] = edge_item
-                    edge_item.edge_id = new_name
+                self.graph_view.rename_edge(old_id, new_name)
                 
                 self.update_edge_list()
                 self.statusBar.showMessage(f"Edge renamed: {old_id} → {new_name}", 2000)
@@ -1727,11 +1854,7 @@ class IntegratedLoadTransferApp(QMainWindow):
                     old_id = edge['id']
                     edge['id'] = new_name
                     
-                    if old_id in self.graph_view.edges:
-                        edge_item = self.graph_view.edges[old_id]
-                        del self.graph_view.edges[old_id]
-                        self.graph_view.edges[new_name] = edge_item
-                        edge_item.edge_id = new_name
+                    self.graph_view.rename_edge(old_id, new_name)
                 
                 # Update interface properties
                 if 'interface_properties' not in edge:
@@ -1861,6 +1984,7 @@ class IntegratedLoadTransferApp(QMainWindow):
         # log scale: 10^(value/50 - 1) gives range from 10^-1 to 10^1
         actual_size = 10 ** ((value - 10) / 45)  # Maps 1->0.1, 10->1.0, 100->10.0
         self.triad_size_label.setText(f"{actual_size:.2f}")
+        # The label follows the slider, the plot waits for the drag to settle
         self.schedule_update()
     
     def get_triad_size(self):
@@ -2023,6 +2147,8 @@ class IntegratedLoadTransferApp(QMainWindow):
     
     def reset_3d_view(self):
         """Reset 3D view to default"""
+        # Same data, but the page has to be rebuilt to reset the camera
+        self._last_fingerprint = None
         self.schedule_update()
         self.statusBar.showMessage("3D view reset", 2000)
     
@@ -2058,7 +2184,7 @@ class IntegratedLoadTransferApp(QMainWindow):
         <ol>
             <li><b>Create Nodes:</b> Click "Add Node" to create load input points</li>
             <li><b>Set Properties:</b> Edit node mass, forces, moments, and position</li>
-            <li><b>Create Connections:</b> Link nodes with edges to define load paths</li>
+            <li><b>Create Connections:</b> Link nodes with edges to define load paths, or Shift+drag from one node to another</li>
             <li><b>Set Interfaces:</b> Edit edge interface properties for output coordinate systems</li>
             <li><b>Calculate:</b> View results in 3D visualization and results table</li>
         </ol>
@@ -2167,18 +2293,21 @@ class IntegratedLoadTransferApp(QMainWindow):
         else:
             self.statusBar.showMessage("Auto-calculate disabled. Click Calculate button to update.", 3000)
     
-    def calculate_node_loads(self, node_id, gravity_value, gravity_dir):
+    def recalculate(self):
+        """Explicit Calculate: always rerun, even if the inputs did not change"""
+        # Edges read upstream results from the previous pass, so a repeat pass
+        # can still change results on graphs whose edges are not in path order
+        self._last_fingerprint = None
+        self.schedule_update()
+    
+    def calculate_node_loads(self, node_id, gravity_value, gravity_dir, frame):
         """Calculate total loads on a node including gravity"""
         node = next((n for n in self.graph_data['nodes'] if n['id'] == node_id), None)
         if not node:
             return np.zeros(3), np.zeros(3)
         
-        # Get node coordinate system
-        R_node, pos_node = rlt.create_rotation_matrix(
-            np.radians(node['euler_angles']),
-            node['rotation_order'],
-            node['translation']
-        )
+        # Node coordinate system, from the caller's batched build
+        R_node, pos_node = frame
         
         # Start with external loads
         force = np.array(node.get('external_force', [0, 0, 0]), dtype=np.float64)
@@ -2187,24 +2316,15 @@ class IntegratedLoadTransferApp(QMainWindow):
         # Add gravity contribution
         if node.get('mass', 0) > 0:
             cog = np.array(node.get('cog', [0, 0, 0]))
-            if np.all(cog == 0):
-                cog_global = np.array(node['translation'])
-            else:
-                cog_global = np.array(node['translation']) + R_node @ cog
             
             # Calculate gravity force in global coordinates
             gravity_force_global = node['mass'] * gravity_value * gravity_dir
             
             # Transform to node local coordinates
-            R_cog, pos_cog = rlt.create_rotation_matrix(
-                np.radians(node['euler_angles']),
-                node['rotation_order'],
-                cog_global
-            )
-            gravity_force_local = R_cog.T @ gravity_force_global
+            gravity_force_local = R_node.T @ gravity_force_global
             
             # Calculate moment due to gravity
-            gravity_moment = np.cross(cog, gravity_force_global)
+            gravity_moment = rlt.cross3(cog, gravity_force_global)
             
             force += gravity_force_local
             moment += gravity_moment
@@ -2226,8 +2346,30 @@ class IntegratedLoadTransferApp(QMainWindow):
         
         return incoming, outgoing, source_nodes
         
+    def _graph_fingerprint(self):
+        """Hash of everything the 3D view and the results are built from"""
+        # Inputs only: the rlt_results each pass writes back are left out
+        edges = [
+            {**edge, 'interface_properties': {
+                key: value for key, value in edge.get('interface_properties', {}).items()
+                if key != 'rlt_results'}}
+            for edge in self.graph_data['edges']
+        ]
+        return hash((
+            json.dumps(self.graph_data['nodes'], sort_keys=True),
+            json.dumps(edges, sort_keys=True),
+            tuple(self.gravity_data['direction']),
+            self.gravity_data['value'],
+            self.triad_slider.value()
+        ))
+    
     def update_visualization(self):
         """Update 3D visualization and calculate cumulative loads through structure"""
+        # Redundant signals and edits reverted before the timer fired leave the
+        # inputs as they were, so the plot and results table are still current
+        fingerprint = self._graph_fingerprint()
+        if fingerprint == self._last_fingerprint:
+            return
         try:
             fig = go.Figure()
             
@@ -2268,19 +2410,22 @@ class IntegratedLoadTransferApp(QMainWindow):
             # Build load path structure
             incoming, outgoing, source_nodes = self.build_load_path_tree()
             
+            # All node frames in one batched build instead of one per node
+            nodes = self.graph_data['nodes']
+            nodes_rad = np.deg2rad(np.array([n['euler_angles'] for n in nodes], dtype=np.float64)).reshape(-1, 3)
+            nodes_R = rlt.create_rotation_matrices(nodes_rad, [n['rotation_order'] for n in nodes])
+            node_frames = {}
+            
             # Visualize all nodes with their coordinate systems
-            for node in self.graph_data['nodes']:
+            for node, euler_rad, R in zip(nodes, nodes_rad, nodes_R):
                 try:
-                    R, pos = rlt.create_rotation_matrix(
-                        np.radians(node['euler_angles']),
-                        node['rotation_order'],
-                        node['translation']
-                    )
+                    pos = np.asarray(node['translation'], dtype=np.float64)
+                    node_frames[node['id']] = (R, pos)
                     color = node.get('color', '#3498db')
                     
                     # Add coordinate system
                     fig_node = plot3d.plot_triad(
-                        np.radians(node['euler_angles']),
+                        euler_rad,
                         node['rotation_order'],
                         node['translation'],
                         tip_size=0.1 * triad_size,
@@ -2312,11 +2457,11 @@ class IntegratedLoadTransferApp(QMainWindow):
                     
                     # Visualize gravity force
                     if node.get('mass', 0) > 0:
-                        cog = np.array(node.get('cog', [0, 0, 0]))
-                        if np.all(cog == 0):
+                        cog = node.get('cog', [0, 0, 0])
+                        if not (cog[0] or cog[1] or cog[2]):
                             cog_global = node['translation']
                         else:
-                            cog_global = np.array(node['translation']) + R @ cog
+                            cog_global = np.array(node['translation']) + R @ np.asarray(cog, dtype=float)
                         
                         # Scale gravity vector for visibility
                         gravity_visual_scale = 0.1  # Scale factor for visualization
@@ -2338,6 +2483,13 @@ class IntegratedLoadTransferApp(QMainWindow):
             # Calculate and visualize loads at each edge interface (OUTPUT coordinate systems)
             self.results_table.setRowCount(len(self.graph_data['edges']))
             
+            # Interface frames, batched like the node frames
+            interfaces = [edge.get('interface_properties', {}) for edge in self.graph_data['edges']]
+            interfaces_rad = np.deg2rad(np.array(
+                [interface.get('euler_angles', [0, 0, 0]) for interface in interfaces], dtype=np.float64)).reshape(-1, 3)
+            interfaces_R = rlt.create_rotation_matrices(
+                interfaces_rad, [interface.get('rotation_order', 'xyz') for interface in interfaces])
+            
             for i, edge in enumerate(self.graph_data['edges']):
                 try:
                     source_id = edge['source']
@@ -2353,21 +2505,18 @@ class IntegratedLoadTransferApp(QMainWindow):
                         continue
                     
                     # Get interface properties (output coordinate system)
-                    interface = edge.get('interface_properties', {})
+                    interface = interfaces[i]
                     interface_pos = interface.get('position', target_node['translation'])
-                    interface_angles = interface.get('euler_angles', [0, 0, 0])
                     interface_order = interface.get('rotation_order', 'xyz')
                     
-                    # Create interface coordinate system
-                    R_interface, pos_interface = rlt.create_rotation_matrix(
-                        np.radians(interface_angles),
-                        interface_order,
-                        interface_pos
-                    )
+                    # Interface coordinate system from the batched build
+                    interface_rad = interfaces_rad[i]
+                    R_interface = interfaces_R[i]
+                    pos_interface = np.asarray(interface_pos, dtype=np.float64)
                     
                     # Visualize interface coordinate system (OUTPUT)
                     fig_interface = plot3d.plot_triad(
-                        np.radians(interface_angles),
+                        interface_rad,
                         interface_order,
                         interface_pos,
                         tip_size=0.1 * triad_size,
@@ -2392,7 +2541,7 @@ class IntegratedLoadTransferApp(QMainWindow):
                     # CUMULATIVE LOAD CALCULATION
                     # Start with source node's own loads
                     total_force, total_moment, R_source, pos_source = self.calculate_node_loads(
-                        source_id, gravity_value, gravity_dir
+                        source_id, gravity_value, gravity_dir, node_frames[source_id]
                     )
                     
                     # Add loads from all incoming edges to source
@@ -2400,8 +2549,9 @@ class IntegratedLoadTransferApp(QMainWindow):
                         if 'interface_properties' in incoming_edge:
                             incoming_results = incoming_edge['interface_properties'].get('rlt_results', {})
                             if incoming_results.get('is_valid', False):
-                                total_force += np.array(incoming_results['force'])
-                                total_moment += np.array(incoming_results['moment'])
+                                # In-place adds straight from the stored lists
+                                total_force += incoming_results['force']
+                                total_moment += incoming_results['moment']
                     
                     # Transfer cumulative loads to interface
                     F_at_interface, M_at_interface = rlt.rigid_load_transfer(
@@ -2481,8 +2631,10 @@ class IntegratedLoadTransferApp(QMainWindow):
             # Display plot
             self.web_view.setHtml(fig.to_html(include_plotlyjs='cdn'))
             self.statusBar.showMessage("Visualization updated - Load path calculated", 2000)
+            self._last_fingerprint = fingerprint
             
         except Exception as e:
+            self._last_fingerprint = None
             self.statusBar.showMessage(f"Error updating visualization: {e}", 5000)
             print(f"Visualization error: {e}")
             import traceback
@@ -3214,6 +3366,8 @@ IntegratedLoadTransferApp.show_test_cases_dialog = show_test_cases_dialog
 # ===================== MAIN ENTRY POINT =====================
 def main():
     """Main entry point for the application"""
+    # Lets Qt WebEngine and an OpenGL graph viewport live in one window
+    QApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
     
     # Set application-wide font